@@ -0,0 +1,479 @@
+"""The window of the dice roller. dice.py and dice-en.py call run
+with their language; everything that doesn't need a window is in
+dice_core.
+
+The settings view asks how many sets to roll and, for each set, its
+name, how many dice it has, how many sides the dice have, and their
+colors. The results view shows a cell for each set, where the set
+can be rolled and the statistics of many simulated rolls can be
+shown, and a button that rolls all sets at once.
+
+The cells of the results view are created once and kept when the
+user switches between the views. When the window is resized, the
+grid is computed again with dice_core.results_layout, and only the
+cells whose position or size changed are moved or resized. If the
+cells don't fit into the window, the results view scrolls.
+"""
+import os
+import warnings
+import tkinter as tk
+from tkinter import Frame, Label, Button, Entry, messagebox, colorchooser
+
+import dice_core
+import instrument
+from dice_layout import ScrollFrame
+from dice_render import get_renderer, HistogramView
+from dice_worker import RollAllWorker
+
+from number_entry import IntEntry
+
+# How many rolls of a set are simulated for its statistics
+SIMULATED_SETS = 1_000_000
+
+# The limits that the texts which ask for valid values show
+SET_LIMITS = {
+    "min_sides": dice_core.MIN_SIDES, "max_sides": dice_core.MAX_SIDES,
+    "min_dice": dice_core.MIN_DICE, "max_dice": dice_core.MAX_DICE,
+    "min_sets": dice_core.MIN_SETS, "max_sets": dice_core.MAX_SETS,
+}
+
+# The parts of a cell's width and height that the histogram uses
+HISTOGRAM_WIDTH_FACTOR = 0.8
+HISTOGRAM_HEIGHT_FACTOR = 0.25
+
+
+class ResultCell:
+    """The widgets of one set in the results view and the last roll
+    that they show, so that the roll can be drawn again in a new size.
+    """
+    def __init__(self, app, parent, index):
+        self.app = app
+        # The cell has a fixed size, which place sets
+        self.frame = Frame(parent, bd=1, relief="groove")
+        self.frame.pack_propagate(False)
+        self.frame.grid_propagate(False)
+
+        # The view where the dice are drawn
+        self.view = app.renderer.create_view(self.frame)
+        self.view.pack(fill="both", expand=True)
+        # A row of buttons below the dice: one rolls the set, one shows its statistics
+        button_frame = Frame(self.frame)
+        button_frame.pack(side="bottom", pady=2)
+        # Below the dice, the histogram of many simulated rolls is shown on request
+        self.stats_view = HistogramView(self.frame, width=1, height=1)
+        self.stats_view.pack(side="bottom")
+        Button(button_frame, text=app.text["statistics"],
+                command=lambda: app.show_statistics(index)).pack(side="right", padx=2)
+        self.roll_button = Button(button_frame, command=lambda: app.roll_single_set(index))
+        self.roll_button.pack(side="right", padx=2)
+
+        self.name = None
+        self.position = None
+        self.size = None
+        # (rolls, sides, dice_color, number_color) of the last roll or None
+        self.last_roll = None
+
+
+    def set_name(self, name):
+        if name != self.name:
+            self.name = name
+            self.roll_button.config(text=self.app.text["roll"].format(name=name))
+
+
+    def place(self, row, column, width, height):
+        """Put the cell into a row and column of the grid and make it
+        width pixels wide and height pixels high.
+        """
+        if (row, column) != self.position:
+            self.position = (row, column)
+            self.frame.grid(row=row, column=column, padx=dice_core.CELL_PADDING,
+                    pady=dice_core.CELL_PADDING, sticky="nsew")
+        if (width, height) != self.size:
+            self.size = (width, height)
+            self.frame.config(width=width, height=height)
+            self.stats_view.resize(int(width * HISTOGRAM_WIDTH_FACTOR),
+                    int(height * HISTOGRAM_HEIGHT_FACTOR))
+            # Draw the last roll again in the new size
+            if self.last_roll is not None:
+                self.show_roll(*self.last_roll)
+
+
+    def dice_size(self, count):
+        return dice_core.dice_size(count, *self.size)
+
+
+    def show_roll(self, rolls, sides, dice_color, number_color, size=None):
+        """Show rolls, each die size pixels wide, or in the size that fits the cell if
+        size is None. The view reuses its existing widgets instead of creating new ones.
+        """
+        self.last_roll = (rolls, sides, dice_color, number_color)
+        if size is None:
+            size = self.dice_size(len(rolls))
+        self.view.show(rolls, sides, dice_color, number_color, size,
+                self.app.total_text(rolls))
+
+
+    def clear(self):
+        self.last_roll = None
+        self.view.clear()
+        self.stats_view.show_message("")
+
+
+    def destroy(self):
+        self.frame.destroy()
+
+
+class DiceApp:
+    """The main window of the dice roller in one of dice_core.LANGUAGES."""
+    def __init__(self, language):
+        self.text = dice_core.strings(language)
+
+        # Create the main application window
+        self.root = tk.Tk()
+        # Set a default font for all widgets
+        self.root.option_add("*Font", "Arial 12")
+        self.root.title(self.text["title"])
+        # Renderer for the dice; setting the environment variable DICE_RENDERER=matplotlib
+        # uses Matplotlib instead (which is only imported then)
+        self.renderer = get_renderer()
+        # Rolls all sets at once on background threads
+        self.roll_worker = RollAllWorker(self.root, self.renderer)
+        # Keeps every roll in a file, written on a background thread (see dice_log).
+        # The log is started by the first roll; None in roll_log_path means the default
+        # file, and an empty DICE_ROLL_LOG turns the log off
+        self.roll_log_path = os.environ.get("DICE_ROLL_LOG")
+        self.roll_log = None
+
+        # The configuration of each set: (name entry, dice count entry,
+        # dice sides entry, dice color label, number color label)
+        self.sets = []
+        # The ResultCell of each set, in the same order as sets
+        self.cells = []
+        # The layout that the cells were last placed with
+        self.layout = None
+        self.window_sized = False
+
+        # Create the settings frame where the user enters the number of sets and their parameters
+        self.settings_frame = Frame(self.root)
+        self.settings_frame.pack(fill="both", expand=True)
+
+        # Top section of the settings frame: entry for the number of sets to roll
+        top_frame = Frame(self.settings_frame)
+        top_frame.pack(side="top", fill="x", pady=5)
+        Label(top_frame, text=self.text["how_many_sets"].format(**SET_LIMITS)
+                ).grid(row=0, column=0, padx=5)
+        self.enter_set = IntEntry(top_frame, width=5,
+                lower_bound=dice_core.MIN_SETS, upper_bound=dice_core.MAX_SETS)
+        self.enter_set.grid(row=0, column=1, padx=5)
+        # Button to proceed to set configuration
+        Button(top_frame, text=self.text["next"],
+                command=self.confirm_sets).grid(row=0, column=2, padx=5)
+        # Button to show the dice results (after configuring the sets)
+        Button(top_frame, text=self.text["confirm_settings"],
+                command=self.show_dice_results).grid(row=0, column=3, padx=5)
+
+        # Frame to hold the configuration of each set; it scrolls if there are many sets
+        settings_scroll = ScrollFrame(self.settings_frame)
+        settings_scroll.pack(fill="both", expand=True)
+        self.grid_frame = settings_scroll.interior
+
+        # Frame that displays the dice roll results, with a header that has a button
+        # to return to settings and one to roll all sets
+        self.results_menu = Frame(self.root)
+        header_frame = Frame(self.results_menu)
+        header_frame.pack(side="top", fill="x", pady=5)
+        Button(header_frame, text=self.text["back_to_settings"],
+                command=self.show_settings).pack(side="left", padx=5, pady=5)
+        self.roll_all_button = Button(header_frame, text=self.text["roll_all"],
+                command=self.roll_all_sets)
+        self.roll_all_button.pack(side="left", padx=5, pady=5)
+        # The cells of the sets; they are placed again whenever the window is resized
+        self.results_scroll = ScrollFrame(self.results_menu, on_resize=self.layout_results)
+        self.results_scroll.pack(fill="both", expand=True)
+
+
+    def mainloop(self):
+        try:
+            self.root.mainloop()
+        finally:
+            if self.roll_log is not None:
+                self.roll_log.close()
+
+
+    def read_set(self, dice_count, dice_sides):
+        """Return the number of dice and sides that the user entered
+        for a set, or raise ValueError if they aren't a valid set.
+        """
+        sides_val = dice_sides.get()
+        count_val = dice_count.get()
+        if not dice_core.is_valid_set(count_val, sides_val):
+            raise ValueError
+        return count_val, sides_val
+
+
+    def set_label(self, index):
+        """Return the name of the set with the given index, or a default name if it has none."""
+        return self.sets[index][0].get() or self.text["default_set_name"].format(number=index + 1)
+
+
+    def open_roll_log(self):
+        """Start the roll log. Its file is opened on the log's own thread, which
+        warns and goes on without it if it can't be opened.
+        """
+        from dice_log import RollLogWriter, DEFAULT_LOG_PATH
+        path = DEFAULT_LOG_PATH if self.roll_log_path is None else self.roll_log_path
+        # The dice roller works without the log.
+        self.roll_log = RollLogWriter(path,
+                on_error=lambda error: warnings.warn(f"rolls are not logged: {error}"))
+
+
+    def log_roll(self, set_label, sides, rolls):
+        """Add a roll of a set to the roll log."""
+        if self.roll_log is None and self.roll_log_path != "":
+            self.open_roll_log()
+        if self.roll_log is not None:
+            self.roll_log.append(set_label, sides, rolls)
+
+
+    def total_text(self, rolls):
+        """Return the text that is shown below the dice, or None if
+        only one die was rolled.
+        """
+        if len(rolls) > 1:
+            return self.text["total"].format(total=sum(rolls))
+        return None
+
+
+    @instrument.timed()
+    def roll_single_set(self, index):
+        """
+        Rolls the set with the given index and displays the results graphically.
+        """
+        set_name, dice_count, dice_sides, dice_color_label, text_color_label = self.sets[index]
+        cell = self.cells[index]
+        try:
+            count_val, sides_val = self.read_set(dice_count, dice_sides)
+        except ValueError:
+            cell.clear()
+            messagebox.showerror(self.text["input_error_title"],
+                    self.text["invalid_set"].format(**SET_LIMITS))
+            return
+        rolls = dice_core.roll_set(count_val, sides_val)
+        self.log_roll(self.set_label(index), sides_val, rolls)
+        cell.show_roll(rolls, sides_val, dice_color_label["bg"], text_color_label["bg"])
+
+
+    def show_statistics(self, index):
+        """
+        Simulates many rolls of a set on a background thread and shows the histogram
+        and the percentiles of the sums when the simulation is done. The window keeps
+        responding while the simulation runs.
+        """
+        stats_view = self.cells[index].stats_view
+        # Don't start a second simulation while the first one is still running
+        if stats_view.busy:
+            return
+        set_name, dice_count, dice_sides, dice_color_label, text_color_label = self.sets[index]
+        try:
+            count_val, sides_val = self.read_set(dice_count, dice_sides)
+        except ValueError:
+            messagebox.showerror(self.text["input_error_title"],
+                    self.text["invalid_set"].format(**SET_LIMITS))
+            return
+
+        def simulation_done(summary, error):
+            stats_view.busy = False
+            # The set may have been removed while the simulation was running
+            if not stats_view.winfo_exists():
+                return
+            if error is not None:
+                stats_view.show_message(self.text["simulation_failed"].format(error=error))
+                return
+            ranks = "  ".join(f"P{rank}: {value}"
+                    for rank, value in summary["simulated_percentiles"].items())
+            stats_view.show(summary, self.text["simulation_result"].format(
+                    sets=summary["sets"], simulated_mean=summary["simulated_mean"],
+                    mean=summary["mean"], ranks=ranks))
+
+        # Statistics are rarely needed, so dice_stats isn't imported at startup
+        from dice_stats import summarize, compute_in_background
+        stats_view.busy = True
+        stats_view.show_message(self.text["simulating"].format(sets=SIMULATED_SETS))
+        compute_in_background(stats_view, simulation_done, summarize,
+                count_val, sides_val, SIMULATED_SETS)
+
+
+    def roll_all_sets(self):
+        """
+        Rolls all sets at once. The rolls, and whatever the renderer can draw off screen, run on
+        background threads, and each set is shown as soon as its rolls are ready. The window keeps
+        responding, and all sets are done in about the time of the slowest one.
+        """
+        # Ignore the button while the previous roll is still being shown
+        if self.roll_worker.busy:
+            return
+        dice_sets = []
+        cells = []
+        labels = []
+        invalid_sets = []
+        for i, (cell, (set_name, dice_count, dice_sides, dice_color_label, text_color_label)) \
+                in enumerate(zip(self.cells, self.sets)):
+            try:
+                count_val, sides_val = self.read_set(dice_count, dice_sides)
+            except ValueError:
+                cell.clear()
+                invalid_sets.append(self.set_label(i))
+                continue
+            # All widgets are read here, because the background threads must not use Tkinter
+            dice_sets.append((count_val, sides_val, dice_color_label["bg"],
+                    text_color_label["bg"], cell.dice_size(count_val)))
+            cells.append(cell)
+            labels.append(self.set_label(i))
+        if invalid_sets:
+            messagebox.showerror(self.text["input_error_title"],
+                    self.text["invalid_sets"].format(names=", ".join(invalid_sets),
+                            **SET_LIMITS))
+
+        def show_set(index, rolls, error):
+            # Called in the Tkinter thread for each set as soon as it is rolled
+            cell = cells[index]
+            count_val, sides_val, dice_color, number_color, die_size = dice_sets[index]
+            if error is None:
+                self.log_roll(labels[index], sides_val, rolls)
+            if not cell.frame.winfo_exists():
+                return
+            if error is not None:
+                cell.clear()
+                return
+            # Show the faces in the size that the renderer prepared them in, unless the
+            # cell was resized during the roll and they don't fit anymore
+            if die_size != cell.dice_size(count_val):
+                die_size = None
+            cell.show_roll(rolls, sides_val, dice_color, number_color, die_size)
+
+        def all_sets_shown():
+            self.roll_all_button.config(state="normal")
+
+        self.roll_all_button.config(state="disabled")
+        self.roll_worker.roll_all(dice_sets, show_set, all_sets_shown)
+
+
+    def confirm_sets(self):
+        """
+        Reads the number of sets entered by the user, validates it,
+        creates a configuration field for each set, and stores the sets.
+        """
+        try:
+            num_sets = self.enter_set.get()
+            if not dice_core.is_valid_set_count(num_sets):
+                raise ValueError
+        except ValueError:
+            messagebox.showerror(self.text["error_title"],
+                    self.text["invalid_set_count"].format(**SET_LIMITS))
+            return
+
+        self.sets = []
+        # Clear any previous set configurations from the grid frame
+        for widget in self.grid_frame.winfo_children():
+            widget.destroy()
+        # The rolls in the results view belong to the old sets
+        for cell in self.cells:
+            cell.clear()
+
+        text = self.text
+        rows, columns = dice_core.settings_grid(num_sets)
+        # Create a configuration frame for each set
+        for i in range(num_sets):
+            set_frame = Frame(self.grid_frame, bd=1, relief="groove", padx=5, pady=5)
+            set_frame.grid(row=i % rows, column=i // rows, padx=10, pady=10, sticky="nsew")
+
+            Label(set_frame, text=text["set_name"].format(number=i + 1)).grid(row=0, column=0, sticky="w")
+            set_name = Entry(set_frame, width=15)
+            set_name.grid(row=0, column=1, padx=5, pady=2)
+
+            Label(set_frame, text=text["dice_count"].format(**SET_LIMITS)).grid(row=1, column=0, sticky="w")
+            dice_count = IntEntry(set_frame, width=5,
+                    lower_bound=dice_core.MIN_DICE, upper_bound=dice_core.MAX_DICE)
+            dice_count.grid(row=1, column=1, padx=5, pady=2)
+
+            Label(set_frame, text=text["dice_sides"].format(**SET_LIMITS)).grid(row=2, column=0, sticky="w")
+            dice_sides = IntEntry(set_frame, width=5,
+                    lower_bound=dice_core.MIN_SIDES, upper_bound=dice_core.MAX_SIDES)
+            dice_sides.grid(row=2, column=1, padx=5, pady=2)
+
+            # Color selection for the dice face
+            Label(set_frame, text=text["dice_color"]).grid(row=3, column=0, sticky="w")
+            dice_color_label = Label(set_frame, text=" ", width=8, relief="solid", bg="white")
+            dice_color_label.grid(row=3, column=1, padx=5, pady=2)
+            Button(set_frame, text=text["choose"],
+                   command=lambda lbl=dice_color_label: lbl.config(bg=colorchooser.askcolor()[1] or "white")
+            ).grid(row=3, column=2, padx=5, pady=2)
+
+            # Color selection for the number or pip color
+            Label(set_frame, text=text["number_color"]).grid(row=4, column=0, sticky="w")
+            text_color_label = Label(set_frame, text=" ", width=8, relief="solid", bg="black")
+            text_color_label.grid(row=4, column=1, padx=5, pady=2)
+            Button(set_frame, text=text["choose"],
+                   command=lambda lbl=text_color_label: lbl.config(bg=colorchooser.askcolor()[1] or "black")
+            ).grid(row=4, column=2, padx=5, pady=2)
+
+            self.sets.append((set_name, dice_count, dice_sides, dice_color_label, text_color_label))
+
+
+    def show_dice_results(self):
+        """
+        Displays the dice roll results by hiding the settings view and showing a cell for each set.
+        The cells of earlier visits are reused; only missing cells are created.
+        """
+        self.settings_frame.pack_forget()
+
+        # The first time, size the window to the screen; after that, the user decides
+        if not self.window_sized:
+            width, height = dice_core.results_window_size(
+                    self.root.winfo_screenwidth(), self.root.winfo_screenheight())
+            self.root.geometry(f"{width}x{height}")
+            self.window_sized = True
+
+        n_sets = len(self.sets)
+        if n_sets != len(self.cells):
+            while len(self.cells) > n_sets:
+                self.cells.pop().destroy()
+            for index in range(len(self.cells), n_sets):
+                self.cells.append(ResultCell(self, self.results_scroll.interior, index))
+            self.layout = None
+        # The names may have changed in the settings
+        for cell, (set_name, *_) in zip(self.cells, self.sets):
+            cell.set_name(set_name.get())
+
+        self.results_menu.pack(fill="both", expand=True)
+        self.layout_results(*self.results_scroll.viewport_size())
+
+
+    def layout_results(self, width, height):
+        """
+        Places the cells for a results view that is width pixels wide and height pixels high.
+        Cells that keep their position and size aren't touched.
+        """
+        if not self.cells:
+            return
+        layout = dice_core.results_layout(len(self.cells), width, height)
+        if layout == self.layout:
+            return
+        self.layout = layout
+        for i, cell in enumerate(self.cells):
+            cell.place(i % layout.rows, i // layout.rows, layout.cell_width, layout.cell_height)
+
+
+    def show_settings(self):
+        """
+        Shows the settings view by hiding the results view.
+        """
+        self.results_menu.pack_forget()
+        self.settings_frame.pack(fill="both", expand=True)
+
+
+def run(language):
+    """Open the window of the dice roller in a language from
+    dice_core.LANGUAGES and wait until the user closes it.
+    """
+    DiceApp(language).mainloop()
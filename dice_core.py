@@ -0,0 +1,149 @@
+"""The parts of the dice roller that don't need a window: rolling sets
+of dice, checking their sizes, the layout math of the results view,
+and the text of the user interface in each language.
+
+This module imports only the standard library and the small instrument
+module, and dice_rng only when the first set is rolled, so a program
+without a display, like a simulation or a web service, can import it
+and roll dice in a few milliseconds. dice_app builds the window on top
+of it, and dice.py and dice-en.py start dice_app in German or in
+English.
+
+The text for a language is in the module dice_strings_<language>,
+which is imported the first time strings is called for that language.
+"""
+import importlib
+import math
+from collections import namedtuple
+from functools import lru_cache
+
+import instrument
+
+MIN_SIDES = 2
+MAX_SIDES = 50
+MIN_DICE = 1
+MAX_DICE = 12
+MIN_SETS = 1
+MAX_SETS = 99
+
+DICE_PER_ROW = 6
+DICE_GAP = 4    # pixels between two dice
+
+# How many sets are shown in one column of the settings and of the
+# results view before more columns are used, and how many columns
+# there may be before the view scrolls instead.
+SETTINGS_ROWS = 4
+SETTINGS_MAX_COLUMNS = 3
+RESULT_ROWS = 3
+
+# A cell of the results view is never smaller than this. If the cells
+# of all sets don't fit into the window, the results view scrolls.
+MIN_CELL_WIDTH = 320
+MIN_CELL_HEIGHT = 240
+CELL_PADDING = 10   # pixels around each cell
+
+# The parts of a cell's width and height that the dice may use.
+DICE_AREA_WIDTH_FACTOR = 0.9
+DICE_AREA_HEIGHT_FACTOR = 0.5
+
+LANGUAGES = ("de", "en")
+
+
+def is_valid_set(count, sides):
+    """Return True if count dice with the given number of sides is a
+    set that the roller can roll and show.
+    """
+    return MIN_DICE <= count <= MAX_DICE and MIN_SIDES <= sides <= MAX_SIDES
+
+
+def is_valid_set_count(n_sets):
+    """Return True if the roller can show n_sets sets."""
+    return MIN_SETS <= n_sets <= MAX_SETS
+
+
+_backend = None
+
+
+def rng_backend():
+    """Return the random number backend that roll_set uses by default.
+    It is chosen with the DICE_RNG environment variable the first time
+    it is needed (see dice_rng).
+    """
+    global _backend
+    if _backend is None:
+        import dice_rng
+        _backend = dice_rng.get_backend()
+    return _backend
+
+
+@instrument.timed()
+def roll_set(count, sides, backend=None):
+    """Return a list with the rolls of count dice with the given number
+    of sides. backend is a backend from dice_rng, or None for the one
+    that rng_backend returns.
+    """
+    if backend is None:
+        backend = rng_backend()
+    return backend.roll(count, sides)
+
+
+# The grid of the results view. Set i is in row i % rows and
+# column i // rows. The size of a cell doesn't include the padding.
+Layout = namedtuple("Layout", "rows columns cell_width cell_height")
+
+
+def settings_grid(n_sets):
+    """Return the number of rows and columns of the settings for
+    n_sets sets. Set i is in row i % rows and column i // rows.
+    """
+    columns = min(math.ceil(n_sets / SETTINGS_ROWS), SETTINGS_MAX_COLUMNS)
+    rows = max(min(n_sets, SETTINGS_ROWS), math.ceil(n_sets / columns))
+    return rows, columns
+
+
+@lru_cache(maxsize=256)
+def results_layout(n_sets, width, height):
+    """Return the Layout of the results view for n_sets sets in an area
+    that is width pixels wide and height pixels high. Up to RESULT_ROWS
+    rows fill the height of the area, and the columns fill its width.
+    If that would make the cells smaller than MIN_CELL_WIDTH, fewer
+    columns with more rows are used, and the area has to scroll.
+    """
+    assert n_sets >= 1, "n_sets must be at least 1"
+    fitting_columns = max(1, width // (MIN_CELL_WIDTH + 2 * CELL_PADDING))
+    columns = min(math.ceil(n_sets / RESULT_ROWS), fitting_columns)
+    rows = max(min(n_sets, RESULT_ROWS), math.ceil(n_sets / columns))
+    visible_rows = min(rows, RESULT_ROWS)
+    cell_width = max(width // columns - 2 * CELL_PADDING, MIN_CELL_WIDTH)
+    cell_height = max(height // visible_rows - 2 * CELL_PADDING, MIN_CELL_HEIGHT)
+    return Layout(rows, columns, cell_width, cell_height)
+
+
+def results_window_size(screen_width, screen_height):
+    """Return the width and height of the results window on a screen
+    of the given size, which leaves a margin around the window.
+    """
+    return screen_width - 50, screen_height - 100
+
+
+def dice_size(count, cell_width, cell_height):
+    """Return the size in whole pixels of each of count dice, so that
+    they fit into a cell that is cell_width wide and cell_height high.
+    Whole pixels let dice of the same size be found again in a cache.
+    """
+    columns = min(DICE_PER_ROW, count)
+    rows = math.ceil(count / DICE_PER_ROW)
+    size = min(cell_width * DICE_AREA_WIDTH_FACTOR / columns,
+            cell_height * DICE_AREA_HEIGHT_FACTOR / rows)
+    return max(int(size) - DICE_GAP, 1)
+
+
+@lru_cache(maxsize=None)
+def strings(language):
+    """Return the dict with the text of the user interface in a
+    language from LANGUAGES.
+    """
+    if language not in LANGUAGES:
+        raise ValueError(f"language must be one of {', '.join(LANGUAGES)},"
+                f" not {language!r}")
+    return importlib.import_module(f"dice_strings_{language}").STRINGS
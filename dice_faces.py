@@ -0,0 +1,209 @@
+"""The Matplotlib renderer for dice_render. This module is imported
+only when that renderer is chosen, because importing Matplotlib is slow.
+
+FaceImageCache turns faces into tkinter PhotoImages and remembers them, so each
+combination of number, sides, colors, and size is drawn by Matplotlib
+only once, on a reused figure, and later rolls only show images that
+already exist. Faces can also be drawn ahead of time on other threads
+with prerender; each thread has its own figure. DiceView shows the images of one set and
+keeps its widgets from one roll to the next.
+"""
+import base64
+import io
+import threading
+from collections import OrderedDict
+
+import tkinter as tk
+from tkinter import Frame, Label
+from matplotlib.figure import Figure
+from matplotlib.patches import Circle
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+import instrument
+from dice_core import MAX_DICE, DICE_PER_ROW, DICE_GAP
+from dice_render import PIP_POSITIONS
+
+DEFAULT_MAX_IMAGES = 512
+
+
+class FaceRenderer:
+    """Draws dice faces into PNG data with one Matplotlib figure that is
+    created once and reused. Instead of clearing the axis and adding new
+    artists for every face, the background color, the pips, and the
+    number are artists that already exist and are only changed, so
+    drawing many faces doesn't create new Matplotlib objects.
+    """
+    def __init__(self):
+        self.figure = Figure(dpi=100)
+        FigureCanvasAgg(self.figure)
+        self.ax = self.figure.add_axes([0, 0, 1, 1])
+        self.ax.set_xticks([])
+        self.ax.set_yticks([])
+        self.ax.set_xlim(0, 0.5)
+        self.ax.set_ylim(0, 0.5)
+
+        # One circle for every position that a pip can have.
+        positions = {xy for dots in PIP_POSITIONS.values() for xy in dots}
+        self.pips = {}
+        for xy in sorted(positions):
+            pip = Circle(xy, 0.04, visible=False)
+            self.ax.add_artist(pip)
+            self.pips[xy] = pip
+        self.text = self.ax.text(0.25, 0.25, "", fontsize=16, ha='center',
+                va='center', fontweight='bold', visible=False)
+
+
+    @instrument.timed()
+    def render_png(self, number, sides, dice_color, text_color, size):
+        """Draw one dice face that is size pixels wide and high.
+        Return: the face as PNG data
+        """
+        self.figure.set_size_inches(size / 100, size / 100)
+        self.ax.set_facecolor(dice_color)
+
+        use_dots = (sides <= 6)
+        dots = set(PIP_POSITIONS.get(number, [(0.25, 0.25)])) if use_dots else ()
+        for xy, pip in self.pips.items():
+            pip.set_visible(xy in dots)
+            pip.set_color(text_color)
+        self.text.set_visible(not use_dots)
+        self.text.set_text(str(number))
+        self.text.set_color(text_color)
+
+        buffer = io.BytesIO()
+        self.figure.savefig(buffer, format="png", dpi=100)
+        return buffer.getvalue()
+
+
+class FaceImageCache:
+    """Remembers up to max_images dice face images. When the cache is
+    full, the face that was used least recently is forgotten. A widget
+    that shows an image must keep a reference to it, so that the image
+    stays alive even after the cache forgets it. At most max_images
+    faces drawn by prerender wait to be shown; if more are drawn, for
+    example for a cell that was resized or removed before its roll was
+    shown, the oldest are forgotten.
+    """
+    def __init__(self, master=None, max_images=DEFAULT_MAX_IMAGES):
+        assert max_images > 0, "max_images must be greater than 0"
+        self.master = master
+        self.max_images = max_images
+        self.hits = 0
+        self.misses = 0
+        self.__images = OrderedDict()
+        # PNG data drawn by prerender that isn't a PhotoImage yet,
+        # oldest first. prerender adds to it from other threads.
+        self.__rendered = OrderedDict()
+        self.__rendered_lock = threading.Lock()
+        self.__local = threading.local()
+
+
+    def __renderer(self):
+        # A Matplotlib figure must not be used by two threads at once.
+        renderer = getattr(self.__local, "renderer", None)
+        if renderer is None:
+            renderer = self.__local.renderer = FaceRenderer()
+        return renderer
+
+
+    def prerender(self, numbers, sides, dice_color, text_color, size):
+        """Draw the faces for numbers that aren't cached yet, so that get
+        only has to turn them into images. Unlike the other methods,
+        this one doesn't use tkinter and may be called from any thread.
+        """
+        for number in set(numbers):
+            key = (number, sides, dice_color, text_color, size)
+            if key in self.__images or key in self.__rendered:
+                continue
+            png = self.__renderer().render_png(number, sides, dice_color,
+                    text_color, size)
+            with self.__rendered_lock:
+                self.__rendered[key] = png
+                if len(self.__rendered) > self.max_images:
+                    self.__rendered.popitem(last=False)
+
+
+    def get(self, number, sides, dice_color, text_color, size):
+        """Return a PhotoImage of a dice face that is size pixels wide."""
+        key = (number, sides, dice_color, text_color, size)
+        image = self.__images.get(key)
+        if image is not None:
+            self.hits += 1
+            self.__images.move_to_end(key)
+            return image
+
+        self.misses += 1
+        with self.__rendered_lock:
+            png = self.__rendered.pop(key, None)
+        if png is None:
+            png = self.__renderer().render_png(number, sides, dice_color,
+                    text_color, size)
+        image = tk.PhotoImage(master=self.master,
+                data=base64.b64encode(png).decode("ascii"))
+        self.__images[key] = image
+        if len(self.__images) > self.max_images:
+            self.__images.popitem(last=False)
+        return image
+
+
+    def __len__(self):
+        return len(self.__images)
+
+
+    def clear(self):
+        """Forget all images."""
+        self.__images.clear()
+        with self.__rendered_lock:
+            self.__rendered.clear()
+
+
+class DiceView(Frame):
+    """A frame that shows the dice of one set and their total. The
+    labels are created once and reused for every roll.
+    """
+    def __init__(self, parent, face_cache, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.face_cache = face_cache
+        self.dice_grid = Frame(self)
+        self.dice_grid.pack(pady=5)
+        self.dice_labels = []
+        for i in range(MAX_DICE):
+            label = Label(self.dice_grid, bd=0)
+            label.image = None
+            label.grid(row=i // DICE_PER_ROW,
+                    column=i % DICE_PER_ROW, padx=DICE_GAP // 2, pady=DICE_GAP // 2)
+            label.grid_remove()
+            self.dice_labels.append(label)
+        self.total_label = Label(self, font=("Arial", 12, "bold"))
+
+
+    @instrument.timed()
+    def show(self, rolls, sides, dice_color, text_color, size, total_text=None):
+        """Show the dice in rolls as size pixel images. If total_text
+        isn't None, show it below the dice.
+        """
+        assert len(rolls) <= MAX_DICE, \
+            f"at most {MAX_DICE} dice can be shown"
+        for label, roll in zip(self.dice_labels, rolls):
+            image = self.face_cache.get(roll, sides, dice_color, text_color, size)
+            # The label keeps a reference, so the image isn't
+            # deleted even if the cache forgets it.
+            if label.image is not image:
+                label.image = image
+                label.config(image=image)
+            label.grid()
+        for label in self.dice_labels[len(rolls):]:
+            label.grid_remove()
+
+        if total_text is None:
+            self.total_label.pack_forget()
+        else:
+            self.total_label.config(text=total_text)
+            self.total_label.pack(pady=5)
+
+
+    def clear(self):
+        """Hide all dice and the total."""
+        for label in self.dice_labels:
+            label.grid_remove()
+        self.total_label.pack_forget()
@@ -0,0 +1,74 @@
+"""This module contains the ScrollFrame class, which dice_app uses for
+the settings and the results view, so that they work for any number
+of sets.
+
+A ScrollFrame shows its interior frame in a Canvas that scrolls
+vertically when the interior is higher than the window. When the
+window is resized, it calls a function with the new size of the
+visible area, but only once the size has stopped changing for a
+moment, so that dragging the border of the window doesn't lay out
+the content dozens of times a second.
+"""
+from tkinter import Frame, Canvas, Scrollbar
+
+from mouse_wheel import bind_mouse_wheel
+
+DEFAULT_RESIZE_DELAY_MS = 50
+
+
+class ScrollFrame(Frame):
+    """A frame with a vertical scrollbar. Put the widgets into
+    interior. If on_resize isn't None, on_resize(width, height) is
+    called with the size of the visible area after it changed.
+    """
+    def __init__(self, parent, on_resize=None,
+            resize_delay=DEFAULT_RESIZE_DELAY_MS, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.on_resize = on_resize
+        self.resize_delay = resize_delay
+        self.canvas = Canvas(self, highlightthickness=0)
+        self.scrollbar = Scrollbar(self, orient="vertical",
+                command=self.canvas.yview)
+        self.canvas.config(yscrollcommand=self.scrollbar.set)
+        self.scrollbar.pack(side="right", fill="y")
+        self.canvas.pack(side="left", fill="both", expand=True)
+
+        self.interior = Frame(self.canvas)
+        self.canvas.create_window(0, 0, window=self.interior, anchor="nw")
+        self.interior.bind("<Configure>", self.__interior_changed)
+        self.canvas.bind("<Configure>", self.__viewport_changed)
+        self.__size = None
+        self.__pending = None
+
+        bind_mouse_wheel(self,
+                lambda units: self.canvas.yview_scroll(units, "units"))
+
+
+    def viewport_size(self):
+        """Return the width and height of the visible area."""
+        if self.__size is None:
+            self.update_idletasks()
+            return self.canvas.winfo_width(), self.canvas.winfo_height()
+        return self.__size
+
+
+    def __interior_changed(self, event):
+        self.canvas.config(scrollregion=(0, 0, event.width, event.height))
+
+
+    def __viewport_changed(self, event):
+        size = (event.width, event.height)
+        if size == self.__size:
+            return
+        self.__size = size
+        if self.on_resize is not None:
+            # Wait until the size stops changing.
+            if self.__pending is not None:
+                self.after_cancel(self.__pending)
+            self.__pending = self.after(self.resize_delay, self.__resized)
+
+
+    def __resized(self):
+        self.__pending = None
+        self.on_resize(*self.__size)
+
@@ -0,0 +1,374 @@
+"""An append-only log of every roll of the dice roller, and queries
+that read it.
+
+The log is a binary file: a 16 byte header followed by records that
+are all RECORD_SIZE bytes long. A record has
+    timestamp   8 bytes, seconds since the epoch as a double
+    set name    NAME_SIZE bytes, UTF-8, padded with zero bytes
+    sides       1 byte
+    count       1 byte, the number of dice
+    dice        MAX_DICE bytes, one per die, 0 for dice that weren't rolled
+and two bytes of padding. Because all records are the same length,
+record i starts at HEADER_SIZE + i * RECORD_SIZE, and the log can be
+read through mmap without parsing it first.
+
+RollLogWriter opens the log and appends records on a background
+thread, so the window that rolls the dice never waits for the disk.
+When it opens a log, it cuts off a record that a crash left half
+written. RollLog maps a log into
+memory and answers queries by scanning the records in place: with
+numpy, the whole map is viewed as one structured array without copying
+it; otherwise the records are unpacked one at a time with
+struct.unpack_from, so a long log is never turned into a list of
+Python objects.
+
+dice_app logs every roll to dice_rolls.log in the current directory,
+or to the file in the DICE_ROLL_LOG environment variable. If that
+variable is set but empty, nothing is logged.
+
+dice_log_check.py checks that RollLog reads back exactly what
+RollLogWriter wrote.
+
+Example:
+    python dice_log.py dice_rolls.log
+"""
+import mmap
+import os
+import queue
+import struct
+import sys
+import threading
+import time
+
+from dice_core import MAX_DICE
+
+MAGIC = b"DICELOG1"
+HEADER = struct.Struct("<8sHH4x")
+HEADER_SIZE = HEADER.size
+NAME_SIZE = 24
+RECORD = struct.Struct(f"<d{NAME_SIZE}sBB{MAX_DICE}s2x")
+RECORD_SIZE = RECORD.size
+
+DEFAULT_LOG_PATH = "dice_rolls.log"
+DEFAULT_BATCH_SIZE = 256
+
+
+def encode_name(name):
+    """Return name as at most NAME_SIZE bytes of UTF-8 without
+    cutting a character in half.
+    """
+    data = name.encode("utf-8")[:NAME_SIZE]
+    return data.decode("utf-8", "ignore").encode("utf-8")
+
+
+def pack_roll(set_name, sides, rolls, timestamp=None):
+    """Return the record for one roll of a set as bytes."""
+    assert 1 <= len(rolls) <= MAX_DICE, f"a roll must have 1 to {MAX_DICE} dice"
+    assert 2 <= sides <= 255, "sides must be between 2 and 255"
+    if timestamp is None:
+        timestamp = time.time()
+    return RECORD.pack(timestamp, encode_name(set_name), sides, len(rolls),
+            bytes(rolls))
+
+
+def _write_header(outfile):
+    outfile.write(HEADER.pack(MAGIC, RECORD_SIZE, 0))
+
+
+def _check_header(data, path):
+    if len(data) < HEADER_SIZE:
+        raise ValueError(f"{path} is too short to be a roll log")
+    magic, record_size, _ = HEADER.unpack_from(data)
+    if magic != MAGIC or record_size != RECORD_SIZE:
+        raise ValueError(f"{path} isn't a roll log of this version")
+
+
+class RollLogWriter:
+    """Appends rolls to a log file on a background thread. The thread
+    also opens the file, checks its header, and cuts off a torn record,
+    so creating a writer doesn't wait for the disk either. append only
+    packs the record and puts it into a queue; the thread writes
+    whatever is in the queue in batches of up to batch_size records.
+
+    If the file can't be opened or isn't a roll log, the exception is
+    kept in the attribute error, on_error(error) is called on the
+    background thread if on_error isn't None, and the rolls that are
+    appended are dropped.
+    """
+    def __init__(self, path=DEFAULT_LOG_PATH, batch_size=DEFAULT_BATCH_SIZE,
+            on_error=None):
+        assert batch_size > 0, "batch_size must be greater than 0"
+        self.path = path
+        self.batch_size = batch_size
+        self.written = 0
+        self.error = None
+        self.__on_error = on_error
+        self.__queue = queue.Queue()
+        self.__file = None
+        self.__thread = threading.Thread(target=self.__run,
+                name="dice-log", daemon=True)
+        self.__thread.start()
+
+
+    def append(self, set_name, sides, rolls, timestamp=None):
+        """Add one roll of a set to the log."""
+        self.__queue.put(pack_roll(set_name, sides, rolls, timestamp))
+
+
+    def __open(self):
+        outfile = open(self.path, "ab")
+        try:
+            size = outfile.tell()
+            if size == 0:
+                _write_header(outfile)
+            else:
+                with open(self.path, "rb") as infile:
+                    _check_header(infile.read(HEADER_SIZE), self.path)
+                # If a crash left part of a record at the end, cut it
+                # off, or every record after it would start at the
+                # wrong offset.
+                torn = (size - HEADER_SIZE) % RECORD_SIZE
+                if torn:
+                    outfile.truncate(size - torn)
+        except BaseException:
+            outfile.close()
+            raise
+        return outfile
+
+
+    def __run(self):
+        try:
+            self.__file = self.__open()
+        except (OSError, ValueError) as error:
+            self.error = error
+            if self.__on_error is not None:
+                self.__on_error(error)
+        finally:
+            # Even without a file, take the records out of the queue,
+            # so that flush and close don't wait forever.
+            self.__write_records()
+
+
+    def __write_records(self):
+        while True:
+            batch = [self.__queue.get()]
+            # Take everything that is already waiting, up to batch_size records.
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.__queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = None in batch
+            records = [record for record in batch if record is not None]
+            if self.__file is not None:
+                self.__file.write(b"".join(records))
+                self.__file.flush()
+                self.written += len(records)
+            for _ in batch:
+                self.__queue.task_done()
+            if stop:
+                return
+
+
+    def flush(self):
+        """Wait until every roll that was appended is in the file."""
+        self.__queue.join()
+
+
+    def close(self):
+        """Write the remaining rolls and close the file."""
+        if self.__thread.is_alive():
+            self.__queue.put(None)
+            self.__thread.join()
+        if self.__file is not None:
+            self.__file.close()
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class RollLog:
+    """A roll log mapped into memory for reading. Call refresh to see
+    the records that were appended after the log was opened.
+    """
+    def __init__(self, path=DEFAULT_LOG_PATH):
+        self.path = path
+        self.__file = open(path, "rb")
+        self.__map = None
+        self.__count = 0
+        try:
+            self.refresh()
+        except BaseException:
+            self.close()
+            raise
+
+
+    def refresh(self):
+        """Map the records that are in the file now."""
+        if self.__map is not None:
+            self.__map.close()
+        size = os.fstat(self.__file.fileno()).st_size
+        self.__map = mmap.mmap(self.__file.fileno(), size,
+                access=mmap.ACCESS_READ) if size else b""
+        _check_header(self.__map[:HEADER_SIZE], self.path)
+        # A record that is only partly written is ignored until it's complete.
+        self.__count = (size - HEADER_SIZE) // RECORD_SIZE
+
+
+    def __len__(self):
+        return self.__count
+
+
+    def __getitem__(self, index):
+        """Return record index as (timestamp, set name, sides, rolls)."""
+        if index < 0:
+            index += self.__count
+        if not 0 <= index < self.__count:
+            raise IndexError("roll log index out of range")
+        return self.__unpack(RECORD.unpack_from(self.__map,
+                HEADER_SIZE + index * RECORD_SIZE))
+
+
+    @staticmethod
+    def __unpack(fields):
+        timestamp, name, sides, count, dice = fields
+        return (timestamp, name.rstrip(b"\0").decode("utf-8"), sides,
+                list(dice[:count]))
+
+
+    def __records(self):
+        """Iterate over the raw fields of the records without copying the log."""
+        unpack_from = RECORD.unpack_from
+        data = self.__map
+        for offset in range(HEADER_SIZE, HEADER_SIZE + self.__count * RECORD_SIZE,
+                RECORD_SIZE):
+            yield unpack_from(data, offset)
+
+
+    def __array(self):
+        """Return the records as a numpy structured array that shares
+        the memory of the map, or None if numpy isn't installed.
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            return None
+        dtype = np.dtype([("timestamp", "<f8"), ("name", f"S{NAME_SIZE}"),
+                ("sides", "u1"), ("count", "u1"), ("dice", "u1", (MAX_DICE,)),
+                ("padding", "V2")])
+        return np.frombuffer(self.__map, dtype=dtype, count=self.__count,
+                offset=HEADER_SIZE)
+
+
+    def frequencies(self):
+        """Return a dict that maps each set name to a list counts,
+        where counts[face] is how often a die of that set showed face.
+        counts[0] is always 0.
+        """
+        records = self.__array() if self.__count else None
+        tables = {}
+        if records is not None:
+            import numpy as np
+            for name in np.unique(records["name"]):
+                mask = records["name"] == name
+                counts = np.bincount(records["dice"][mask].ravel(), minlength=256)
+                counts[0] = 0
+                highest = int(records["sides"][mask].max())
+                tables[name.decode("utf-8")] = counts[:highest + 1].tolist()
+            return tables
+
+        highest = {}
+        for _, name, sides, count, dice in self.__records():
+            counts = tables.get(name)
+            if counts is None:
+                counts = tables[name] = [0] * 256
+                highest[name] = sides
+            elif sides > highest[name]:
+                highest[name] = sides
+            for face in dice[:count]:
+                counts[face] += 1
+        return {name.rstrip(b"\0").decode("utf-8"): counts[:highest[name] + 1]
+                for name, counts in tables.items()}
+
+
+    def streaks(self, set_name, min_length=3):
+        """Find the runs of consecutive rolls of a set that all had the
+        same total.
+        Return: a list of tuples (index of the first record, number
+            of rolls, total) for each run of at least min_length rolls
+        """
+        assert min_length >= 1, "min_length must be at least 1"
+        key = encode_name(set_name).ljust(NAME_SIZE, b"\0")
+        records = self.__array() if self.__count else None
+        if records is not None:
+            import numpy as np
+            indexes = np.flatnonzero(records["name"] == key.rstrip(b"\0"))
+            totals = records["dice"][indexes].sum(axis=1, dtype=np.int64)
+            if len(totals) == 0:
+                return []
+            # The positions where a new run starts.
+            starts = np.flatnonzero(np.diff(totals, prepend=totals[0] - 1))
+            lengths = np.diff(starts, append=len(totals))
+            return [(int(indexes[start]), int(length), int(totals[start]))
+                    for start, length in zip(starts, lengths)
+                    if length >= min_length]
+
+        runs = []
+        first = length = total = None
+        for index, (_, name, _, count, dice) in enumerate(self.__records()):
+            if name != key:
+                continue
+            roll_total = sum(dice[:count])
+            if roll_total == total:
+                length += 1
+            else:
+                if length is not None and length >= min_length:
+                    runs.append((first, length, total))
+                first, length, total = index, 1, roll_total
+        if length is not None and length >= min_length:
+            runs.append((first, length, total))
+        return runs
+
+
+    def close(self):
+        if self.__map:
+            self.__map.close()
+        self.__file.close()
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Show the frequencies and"
+            " streaks of the rolls in a roll log.")
+    parser.add_argument("path", nargs="?", default=DEFAULT_LOG_PATH)
+    parser.add_argument("--min-streak", type=int, default=3,
+            help="the shortest run of equal totals that is shown")
+    args = parser.parse_args(argv)
+
+    with RollLog(args.path) as log:
+        print(f"{len(log)} rolls in {args.path}")
+        for name, counts in sorted(log.frequencies().items()):
+            rolled = sum(counts)
+            print(f"\n{name or '(no name)'}: {rolled} dice")
+            for face, n in enumerate(counts[1:], start=1):
+                print(f"  {face:2}: {n:8} {n / rolled:7.2%}")
+            for first, length, total in log.streaks(name, args.min_streak):
+                print(f"  streak of {length} rolls with total {total},"
+                        f" starting at roll {first + 1}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,200 @@
+"""Check that RollLog reads back exactly what RollLogWriter wrote.
+
+The check writes random rolls of several sets to a log in a temporary
+directory, in two sessions with a half written record between them,
+like a crash would leave. Some set names are longer than NAME_SIZE
+bytes and have characters that aren't ASCII, and one set is rolled with
+the same total many times in a row. It then compares every record of
+RollLog, and its frequencies and streaks, with what was written, and
+checks that a writer leaves a file that isn't a roll log alone. If any
+answer differs, the check prints it and exits with 1.
+
+Without numpy, RollLog unpacks the records one at a time, so run the
+check with and without numpy to test both ways.
+
+Example:
+    python dice_log_check.py --rolls 100000
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+
+from dice_core import MAX_DICE
+from dice_log import (RollLogWriter, RollLog, encode_name, HEADER_SIZE,
+        RECORD_SIZE)
+
+SET_NAMES = ["", "Attack", "Schaden", "Würfel für die Verteidigung",
+        "Angriff mit dem großen Schwert", "骰子骰子骰子骰子骰子", "Set 7"]
+STREAK_SET = "Attack"
+
+
+def make_rolls(count, seed):
+    """Return count tuples (timestamp, set name, sides, rolls)."""
+    rng = random.Random(seed)
+    rolls = []
+    timestamp = 1_700_000_000.0
+    for i in range(count):
+        timestamp += rng.random()
+        if i % 1000 < 5:
+            # A streak: the same total five times in a row.
+            rolls.append((timestamp, STREAK_SET, 6, [3, 4]))
+            continue
+        sides = rng.randint(2, 50)
+        dice = [rng.randint(1, sides) for _ in range(rng.randint(1, MAX_DICE))]
+        rolls.append((timestamp, rng.choice(SET_NAMES), sides, dice))
+    return rolls
+
+
+def write_rolls(path, rolls):
+    with RollLogWriter(path) as writer:
+        for timestamp, name, sides, dice in rolls:
+            writer.append(name, sides, dice, timestamp)
+    if writer.error is not None:
+        raise writer.error
+    return writer.written
+
+
+def expected_frequencies(records):
+    tables = {}
+    highest = {}
+    for _, name, sides, dice in records:
+        counts = tables.setdefault(name, [0] * 51)
+        highest[name] = max(highest.get(name, 0), sides)
+        for face in dice:
+            counts[face] += 1
+    return {name: counts[:highest[name] + 1] for name, counts in tables.items()}
+
+
+def expected_streaks(records, name, min_length):
+    runs = []
+    run = None
+    for index, (_, record_name, _, dice) in enumerate(records):
+        if record_name != name:
+            continue
+        total = sum(dice)
+        if run is not None and run[2] == total:
+            run[1] += 1
+        else:
+            if run is not None and run[1] >= min_length:
+                runs.append(tuple(run))
+            run = [index, 1, total]
+    if run is not None and run[1] >= min_length:
+        runs.append(tuple(run))
+    return runs
+
+
+def check_log(directory, rolls):
+    """Write rolls to a new log in directory and return a list of
+    messages for every answer of RollLog that differs from them.
+    """
+    mismatches = []
+    path = os.path.join(directory, "check.log")
+    half = len(rolls) // 2
+    written = write_rolls(path, rolls[:half])
+    # The map of this log ends before the torn record, so it stays
+    # valid when the next writer cuts that record off.
+    with RollLog(path) as log:
+        # What a crash in the middle of writing a record leaves behind.
+        with open(path, "ab") as outfile:
+            outfile.write(bytes(RECORD_SIZE // 2))
+        with RollLog(path) as torn_log:
+            if len(torn_log) != half:
+                mismatches.append(f"with a torn record, len is"
+                        f" {len(torn_log)}, expected {half}")
+        written += write_rolls(path, rolls[half:])
+        log.refresh()
+        if len(log) != len(rolls):
+            mismatches.append(f"after refresh, len is {len(log)},"
+                    f" expected {len(rolls)}")
+    if written != len(rolls):
+        mismatches.append(f"the writers wrote {written} records,"
+                f" expected {len(rolls)}")
+    size = os.path.getsize(path)
+    if size != HEADER_SIZE + len(rolls) * RECORD_SIZE:
+        mismatches.append(f"the log has {size} bytes, expected"
+                f" {HEADER_SIZE + len(rolls) * RECORD_SIZE}")
+
+    # The names are read back as they were cut to NAME_SIZE bytes.
+    expected = [(timestamp, encode_name(name).decode("utf-8"), sides, dice)
+            for timestamp, name, sides, dice in rolls]
+    with RollLog(path) as log:
+        if len(log) != len(expected):
+            mismatches.append(f"len is {len(log)}, expected {len(expected)}")
+        for index, record in enumerate(expected[:len(log)]):
+            if log[index] != record:
+                mismatches.append(f"record {index} is {log[index]},"
+                        f" expected {record}")
+        if expected and log[-1] != expected[-1]:
+            mismatches.append(f"record -1 is {log[-1]}, expected {expected[-1]}")
+
+        frequencies = log.frequencies()
+        wanted = expected_frequencies(expected)
+        for name in sorted(set(frequencies) | set(wanted)):
+            if frequencies.get(name) != wanted.get(name):
+                mismatches.append(f"the frequencies of {name!r} are"
+                        f" {frequencies.get(name)}, expected {wanted.get(name)}")
+
+        for name in SET_NAMES:
+            for min_length in (1, 3, 5):
+                streaks = log.streaks(name, min_length)
+                wanted = expected_streaks(expected,
+                        encode_name(name).decode("utf-8"), min_length)
+                if streaks != wanted:
+                    mismatches.append(f"the streaks of {name!r} with at least"
+                            f" {min_length} rolls differ: {streaks[:3]}...,"
+                            f" expected {wanted[:3]}...")
+    return mismatches
+
+
+def check_not_a_log(directory):
+    """Return a list of messages if a writer changes a file that
+    isn't a roll log or doesn't report it.
+    """
+    path = os.path.join(directory, "not_a_log.txt")
+    content = b"This file isn't a roll log.\n"
+    with open(path, "wb") as outfile:
+        outfile.write(content)
+    with RollLogWriter(path) as writer:
+        writer.append("Attack", 6, [1, 2])
+    mismatches = []
+    if not isinstance(writer.error, ValueError):
+        mismatches.append(f"a file that isn't a roll log gave the error"
+                f" {writer.error!r}, expected a ValueError")
+    with open(path, "rb") as infile:
+        if infile.read() != content:
+            mismatches.append("a writer changed a file that isn't a roll log")
+    try:
+        RollLog(path).close()
+    except ValueError:
+        pass
+    else:
+        mismatches.append("RollLog opened a file that isn't a roll log")
+    return mismatches
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rolls", type=int, default=20_000,
+            help="how many random rolls are written")
+    parser.add_argument("--seed", type=int, default=2024)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        mismatches = check_log(directory, make_rolls(args.rolls, args.seed))
+        mismatches += check_not_a_log(directory)
+
+    if mismatches:
+        for message in mismatches[:20]:
+            print(message, file=sys.stderr)
+        print(f"{len(mismatches)} answers of RollLog differ from what was"
+                " written", file=sys.stderr)
+        return 1
+    print(f"RollLog reads back all {args.rolls:,} rolls that RollLogWriter"
+            " wrote.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
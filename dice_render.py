@@ -0,0 +1,269 @@
+"""Renderers that draw the dice of a set for dice.py and dice-en.py.
+
+A renderer creates one view for each set. A view is a tkinter Frame
+with two methods, show and clear, that show or hide the rolled dice
+and their total. A renderer's prepare method does the part of the
+drawing that doesn't need tkinter and may be called from any thread
+before show, as dice_worker does. There are two renderers:
+
+    canvas      draws squares, pips, and numbers directly on a tkinter
+                Canvas. This is the default and needs only tkinter.
+    matplotlib  draws each face once with Matplotlib and shows cached
+                images (see dice_faces). Matplotlib is imported only
+                when this renderer is chosen.
+
+The renderer is chosen with get_renderer, either by name or with the
+DICE_RENDERER environment variable.
+
+HistogramView draws the results of dice_stats.summarize, whichever
+renderer draws the dice.
+"""
+import os
+from tkinter import Frame, Canvas, Label
+
+import instrument
+from dice_core import MAX_DICE, DICE_PER_ROW, DICE_GAP
+
+# Positions of the pips for the typical dice faces on a face that
+# is 0.5 wide and 0.5 high, with y = 0 at the bottom.
+PIP_POSITIONS = {
+    1: [(0.25, 0.25)],  # One pip in the center
+    2: [(0.1, 0.4), (0.4, 0.1)],  # Two pips diagonally placed
+    3: [(0.1, 0.4), (0.25, 0.25), (0.4, 0.1)],  # Three pips with one in the center
+    4: [(0.1, 0.4), (0.4, 0.4), (0.1, 0.1), (0.4, 0.1)],  # Four pips in the corners
+    5: [(0.1, 0.4), (0.4, 0.4), (0.1, 0.1), (0.4, 0.1), (0.25, 0.25)],  # Four corners plus a center pip
+    6: [(0.1, 0.4), (0.4, 0.4), (0.1, 0.25), (0.4, 0.25), (0.1, 0.1), (0.4, 0.1)]  # Six pips in two columns
+}
+PIP_RADIUS = 0.04
+
+DEFAULT_RENDERER = "canvas"
+
+
+class CanvasDiceView(Frame):
+    """A frame that draws the dice of one set on a tkinter Canvas.
+    The canvas items for all dice are created once and then only
+    moved, recolored, shown, or hidden.
+    """
+    def __init__(self, parent, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.canvas = Canvas(self, width=0, height=0, highlightthickness=0)
+        self.canvas.pack(pady=5)
+        self.total_label = Label(self, font=("Arial", 12, "bold"))
+
+        # Every pip position that any face uses.
+        self.positions = sorted({xy for dots in PIP_POSITIONS.values()
+                for xy in dots})
+        self.dice = []
+        for _ in range(MAX_DICE):
+            face = self.canvas.create_rectangle(0, 0, 0, 0, outline="black",
+                    state="hidden")
+            pips = [self.canvas.create_oval(0, 0, 0, 0, width=0,
+                    state="hidden") for _ in self.positions]
+            text = self.canvas.create_text(0, 0, font=("Arial", 16, "bold"),
+                    state="hidden")
+            self.dice.append((face, pips, text))
+        self.size = None
+        self.shown = 0
+
+
+    def __place(self, size):
+        """Move the canvas items so that each dice is size pixels wide."""
+        canvas = self.canvas
+        scale = size / 0.5
+        radius = PIP_RADIUS * scale
+        for i, (face, pips, text) in enumerate(self.dice):
+            left = (i % DICE_PER_ROW) * (size + DICE_GAP) + DICE_GAP // 2
+            top = (i // DICE_PER_ROW) * (size + DICE_GAP) + DICE_GAP // 2
+            canvas.coords(face, left, top, left + size, top + size)
+            for (x, y), pip in zip(self.positions, pips):
+                cx = left + x * scale
+                cy = top + (0.5 - y) * scale
+                canvas.coords(pip, cx - radius, cy - radius,
+                        cx + radius, cy + radius)
+            canvas.coords(text, left + size / 2, top + size / 2)
+        self.size = size
+
+
+    @instrument.timed()
+    def show(self, rolls, sides, dice_color, text_color, size, total_text=None):
+        """Draw the dice in rolls, each size pixels wide. If
+        total_text isn't None, show it below the dice.
+        """
+        assert len(rolls) <= MAX_DICE, f"at most {MAX_DICE} dice can be shown"
+        canvas = self.canvas
+        if size != self.size:
+            self.__place(size)
+        columns = min(DICE_PER_ROW, len(rolls))
+        rows = (len(rolls) + DICE_PER_ROW - 1) // DICE_PER_ROW
+        canvas.config(width=columns * (size + DICE_GAP),
+                height=rows * (size + DICE_GAP))
+
+        use_dots = (sides <= 6)
+        for (face, pips, text), roll in zip(self.dice, rolls):
+            canvas.itemconfig(face, fill=dice_color, state="normal")
+            if use_dots:
+                dots = PIP_POSITIONS.get(roll, [(0.25, 0.25)])
+                for xy, pip in zip(self.positions, pips):
+                    if xy in dots:
+                        canvas.itemconfig(pip, fill=text_color, state="normal")
+                    else:
+                        canvas.itemconfig(pip, state="hidden")
+                canvas.itemconfig(text, state="hidden")
+            else:
+                for pip in pips:
+                    canvas.itemconfig(pip, state="hidden")
+                canvas.itemconfig(text, text=str(roll), fill=text_color,
+                        state="normal")
+
+        # Hide the dice that were shown by the previous roll but not this one.
+        for face, pips, text in self.dice[len(rolls):self.shown]:
+            for item in (face, text, *pips):
+                canvas.itemconfig(item, state="hidden")
+        self.shown = len(rolls)
+
+        if total_text is None:
+            self.total_label.pack_forget()
+        else:
+            self.total_label.config(text=total_text)
+            self.total_label.pack(pady=5)
+
+
+    def clear(self):
+        """Hide all dice and the total."""
+        self.canvas.itemconfig("all", state="hidden")
+        self.shown = 0
+        self.total_label.pack_forget()
+
+
+class HistogramView(Frame):
+    """A frame that draws the simulated and the exact distribution of
+    the sums of a set on a Canvas, with the percentiles below it. The
+    bars are the simulated frequencies, the line is the exact
+    probability.
+    """
+    def __init__(self, parent, width=300, height=120, bar_color="steelblue",
+            line_color="firebrick", **kwargs):
+        super().__init__(parent, **kwargs)
+        self.width = width
+        self.height = height
+        self.bar_color = bar_color
+        self.line_color = line_color
+        self.canvas = Canvas(self, width=width, height=height,
+                highlightthickness=0)
+        self.canvas.pack()
+        self.info_label = Label(self, font=("Arial", 10))
+        self.info_label.pack()
+        # True while a simulation for this view is running.
+        self.busy = False
+        self.summary = None
+
+
+    def resize(self, width, height):
+        """Change the size of the histogram and draw it again."""
+        if (width, height) == (self.width, self.height):
+            return
+        self.width = width
+        self.height = height
+        self.canvas.config(width=width, height=height)
+        if self.summary is not None:
+            self.show(self.summary, self.info_label["text"])
+
+
+    def show_message(self, text):
+        """Remove the histogram and show text instead."""
+        self.summary = None
+        self.canvas.delete("all")
+        self.info_label.config(text=text)
+
+
+    @instrument.timed()
+    def show(self, summary, info_text):
+        """Draw the histogram of a summary from dice_stats.summarize
+        and show info_text below it.
+        """
+        self.summary = summary
+        canvas = self.canvas
+        canvas.delete("all")
+        exact = summary["exact"]
+        sets = summary["sets"]
+        first = summary["count"]
+        sums = range(first, len(exact))
+        simulated = [summary["simulated"][s] / sets if sets else 0 for s in sums]
+        exact = [exact[s] for s in sums]
+        highest = max(max(exact), max(simulated)) or 1
+
+        margin = 12
+        bar_width = (self.width - 2 * margin) / len(sums)
+        scale = (self.height - 2 * margin) / highest
+        bottom = self.height - margin
+        for i, frequency in enumerate(simulated):
+            left = margin + i * bar_width
+            canvas.create_rectangle(left, bottom - frequency * scale,
+                    left + max(bar_width - 1, 1), bottom,
+                    fill=self.bar_color, width=0)
+        points = []
+        for i, probability in enumerate(exact):
+            points += [margin + (i + 0.5) * bar_width, bottom - probability * scale]
+        # A set has at least two possible sums, so this is a line.
+        canvas.create_line(*points, fill=self.line_color, width=2)
+        canvas.create_line(margin, bottom, self.width - margin, bottom)
+        canvas.create_text(margin, bottom + 2, text=str(first), anchor="n",
+                font=("Arial", 8))
+        canvas.create_text(self.width - margin, bottom + 2,
+                text=str(len(summary["exact"]) - 1), anchor="n", font=("Arial", 8))
+        self.info_label.config(text=info_text)
+
+
+class CanvasRenderer:
+    """Draws dice with tkinter only."""
+    name = "canvas"
+
+    def create_view(self, parent):
+        return CanvasDiceView(parent)
+
+
+    def prepare(self, rolls, sides, dice_color, text_color, size):
+        # Everything is drawn by the canvas in show.
+        pass
+
+
+class MatplotlibRenderer:
+    """Draws dice faces with Matplotlib into cached images."""
+    name = "matplotlib"
+
+    def __init__(self, max_images=None):
+        self.max_images = max_images
+        self.face_cache = None
+
+
+    def create_view(self, parent):
+        # Import Matplotlib only when this renderer is really used.
+        from dice_faces import FaceImageCache, DiceView, DEFAULT_MAX_IMAGES
+        if self.face_cache is None:
+            self.face_cache = FaceImageCache(parent.winfo_toplevel(),
+                    self.max_images or DEFAULT_MAX_IMAGES)
+        return DiceView(parent, self.face_cache)
+
+
+    def prepare(self, rolls, sides, dice_color, text_color, size):
+        if self.face_cache is not None:
+            self.face_cache.prerender(rolls, sides, dice_color, text_color, size)
+
+
+RENDERERS = {
+    CanvasRenderer.name: CanvasRenderer,
+    MatplotlibRenderer.name: MatplotlibRenderer,
+}
+
+
+def get_renderer(name=None):
+    """Return a new renderer. If name is None, the name in the
+    DICE_RENDERER environment variable is used, or "canvas".
+    """
+    if name is None:
+        name = os.environ.get("DICE_RENDERER", DEFAULT_RENDERER)
+    renderer_class = RENDERERS.get(name.lower())
+    if renderer_class is None:
+        raise ValueError(f"unknown dice renderer {name!r}; "
+                f"choose one of {', '.join(RENDERERS)}")
+    return renderer_class()
@@ -0,0 +1,124 @@
+"""Measure the startup time and the time per roll of the dice renderers.
+
+Startup is measured in a new Python process for each run, so that
+every import is really done. The time per roll needs a display; if
+none is set, Xvfb is started like in number_entry_harness.
+
+Example:
+    python dice_render_benchmark.py --rolls 500 --output report.json
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+# The modules that each way of drawing the dice imports at startup.
+STARTUP_IMPORTS = {
+    "canvas": "import tkinter, number_entry, dice_render",
+    "matplotlib": "import tkinter, number_entry, dice_render, dice_faces",
+    # What dice.py imported before it had renderers.
+    "pyplot (old)": "import tkinter, number_entry, numpy, matplotlib.pyplot,"
+                    " matplotlib.backends.backend_tkagg",
+}
+
+
+def measure_startup(statement, runs):
+    """Return the median number of seconds that a new Python
+    process needs to run statement, or None if it fails.
+    """
+    code = ("import time; start = time.perf_counter(); "
+            f"{statement}; print(time.perf_counter() - start)")
+    times = []
+    for _ in range(runs):
+        result = subprocess.run([sys.executable, "-c", code],
+                capture_output=True, text=True,
+                cwd=os.path.dirname(os.path.abspath(__file__)))
+        if result.returncode != 0:
+            return None
+        times.append(float(result.stdout))
+    return statistics.median(times)
+
+
+def measure_rolls(name, rolls, seed):
+    """Return the times in seconds of rolls rolls drawn by a renderer."""
+    import tkinter as tk
+    from dice_render import get_renderer
+
+    rng = random.Random(seed)
+    root = tk.Tk()
+    try:
+        view = get_renderer(name).create_view(root)
+        view.pack()
+        root.update()
+        times = []
+        for _ in range(rolls):
+            count = rng.randint(1, 12)
+            sides = rng.choice((6, 20))
+            values = [rng.randint(1, sides) for _ in range(count)]
+            start = time.perf_counter()
+            view.show(values, sides, "white", "black", 60, f"Total: {sum(values)}")
+            root.update_idletasks()
+            times.append(time.perf_counter() - start)
+        return times
+    finally:
+        root.destroy()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--startup-runs", type=int, default=5)
+    parser.add_argument("--rolls", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=2024)
+    parser.add_argument("--output", default="dice_render_benchmark.json",
+            help="file where the JSON report is written")
+    args = parser.parse_args(argv)
+
+    report = {"startup_seconds": {}, "roll_ms": {}}
+    for name, statement in STARTUP_IMPORTS.items():
+        seconds = measure_startup(statement, args.startup_runs)
+        report["startup_seconds"][name] = seconds
+        shown = "not available" if seconds is None else f"{seconds * 1000:8.1f} ms"
+        print(f"startup {name:>14}: {shown}")
+
+    from number_entry_harness import start_virtual_display
+    try:
+        xvfb = start_virtual_display()
+    except SystemExit as error:
+        # Without a display only the startup can be measured.
+        print(f"roll times not measured: {error}")
+        names = ()
+        xvfb = None
+    else:
+        names = ("canvas", "matplotlib")
+    try:
+        for name in names:
+            try:
+                times = measure_rolls(name, args.rolls, args.seed)
+            except ImportError as error:
+                print(f"roll    {name:>14}: not available ({error})")
+                report["roll_ms"][name] = None
+                continue
+            warm = sorted(times[1:]) or times
+            result = {
+                "first": times[0] * 1000,
+                "p50": warm[len(warm) // 2] * 1000,
+                "p99": warm[min(int(len(warm) * 0.99), len(warm) - 1)] * 1000,
+            }
+            report["roll_ms"][name] = result
+            print(f"roll    {name:>14}: first {result['first']:7.2f} ms"
+                    f"  p50 {result['p50']:7.2f} ms  p99 {result['p99']:7.2f} ms")
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+
+    with open(args.output, "wt") as outfile:
+        json.dump(report, outfile, indent=2)
+    print(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""Random number backends for rolling dice.
+
+Every backend has the same two methods:
+    roll(count, sides)         returns a list with the rolls of count dice
+    roll_bytes(n, sides)       returns n rolls as bytes, one byte per roll,
+                               for rolling many dice at once
+There are three backends:
+
+    mersenne  the Mersenne Twister of the random module, like
+              random.randint. Fast and reproducible with a seed, but
+              predictable for anyone who sees enough rolls.
+    secrets   the operating system's cryptographically strong random
+              numbers from os.urandom, which the secrets module also uses.
+              Use it when the rolls must not be predictable, like in a
+              tournament.
+    numpy     numpy's PCG64 generator, which draws whole arrays of rolls
+              at once. numpy is imported only when this backend is used.
+
+The mersenne and secrets backends turn random bytes into rolls with
+rejection sampling: for sides s, only bytes below the largest multiple
+of s that is at most 256 are used, and the others are thrown away.
+Otherwise, taking byte % s would make the small faces of a die whose
+sides don't divide 256, like a six-sided one, come up more often.
+numpy's integers method already samples without bias.
+
+The backend is chosen with get_backend, either by name or with the
+DICE_RNG environment variable.
+"""
+import os
+import random
+import threading
+from functools import lru_cache
+
+DEFAULT_BACKEND = "mersenne"
+MAX_SIDES = 255     # a roll must fit into one byte
+
+# Draw at least this many bytes at once, so that
+# rolling a few dice doesn't ask for a few bytes at a time.
+MIN_DRAW = 64
+
+
+# Each table is made the first time a die with that many sides is
+# rolled, so importing this module doesn't make all 254 of them.
+@lru_cache(maxsize=None)
+def _rejection_tables(sides):
+    """Return a table for bytes.translate that turns each byte into
+    a roll between 1 and sides, and the bytes that must be thrown away.
+    """
+    limit = 256 - 256 % sides
+    table = bytes(b % sides + 1 if b < limit else 0 for b in range(256))
+    return table, bytes(range(limit, 256))
+
+
+def _check(n, sides):
+    if not 2 <= sides <= MAX_SIDES:
+        raise ValueError(f"sides must be between 2 and {MAX_SIDES}, not {sides}")
+    if n < 0:
+        raise ValueError(f"the number of rolls must not be negative, not {n}")
+
+
+class ByteBackend:
+    """A backend that makes rolls from random bytes. Subclasses
+    implement random_bytes(n).
+    """
+    name = None
+
+    def roll_bytes(self, n, sides):
+        _check(n, sides)
+        table, rejected = _rejection_tables(sides)
+        rolls = bytearray()
+        while len(rolls) < n:
+            # Ask for a little more than is missing, because some
+            # bytes are thrown away.
+            missing = n - len(rolls)
+            data = self.random_bytes(max(missing + missing // 4, MIN_DRAW))
+            rolls += data.translate(table, rejected)
+        return bytes(rolls[:n])
+
+
+    def roll(self, count, sides):
+        return list(self.roll_bytes(count, sides))
+
+
+class MersenneBackend(ByteBackend):
+    """Rolls with a random.Random, the Mersenne Twister."""
+    name = "mersenne"
+
+    def __init__(self, seed=None):
+        self.rng = random.Random(seed)
+
+
+    def random_bytes(self, n):
+        return self.rng.randbytes(n)
+
+
+class SecretsBackend(ByteBackend):
+    """Rolls with cryptographically strong random bytes from the
+    operating system.
+    """
+    name = "secrets"
+
+    def random_bytes(self, n):
+        return os.urandom(n)
+
+
+class NumpyBackend:
+    """Rolls whole arrays of dice with numpy's PCG64 generator."""
+    name = "numpy"
+
+    def __init__(self, seed=None):
+        import numpy as np
+        self.np = np
+        self.rng = np.random.Generator(np.random.PCG64(seed))
+        # A numpy Generator must not be used by two threads at once.
+        self.lock = threading.Lock()
+
+
+    def roll_array(self, n, sides):
+        """Return n rolls as a numpy array of uint8."""
+        _check(n, sides)
+        with self.lock:
+            return self.rng.integers(1, sides + 1, size=n, dtype=self.np.uint8)
+
+
+    def roll_bytes(self, n, sides):
+        return self.roll_array(n, sides).tobytes()
+
+
+    def roll(self, count, sides):
+        return self.roll_array(count, sides).tolist()
+
+
+BACKENDS = {
+    MersenneBackend.name: MersenneBackend,
+    SecretsBackend.name: SecretsBackend,
+    NumpyBackend.name: NumpyBackend,
+}
+
+
+def get_backend(name=None, seed=None):
+    """Return a new backend. If name is None, the name in the DICE_RNG
+    environment variable is used, or "mersenne". seed is ignored by the
+    secrets backend, which can't be repeated.
+    """
+    if name is None:
+        name = os.environ.get("DICE_RNG", DEFAULT_BACKEND)
+    backend_class = BACKENDS.get(name.lower())
+    if backend_class is None:
+        raise ValueError(f"unknown random number backend {name!r}; "
+                f"choose one of {', '.join(BACKENDS)}")
+    if backend_class is SecretsBackend:
+        return backend_class()
+    return backend_class(seed)
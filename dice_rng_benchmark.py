@@ -0,0 +1,88 @@
+"""Measure how many rolls per second each backend in dice_rng makes,
+and check that the faces come up equally often.
+
+For each backend and number of sides, two ways of rolling are timed:
+rolling one set of dice at a time, like the dice roller does, and
+rolling many dice at once with roll_bytes, like a simulation would.
+The chi-square statistic of the bulk rolls is printed next to the
+value that it exceeds only 1% of the time for fair dice.
+
+Example:
+    python dice_rng_benchmark.py --rolls 1000000 --output report.json
+"""
+import argparse
+import json
+import time
+
+from dice_rng import BACKENDS, get_backend
+
+SIDES = (6, 20, 50)
+SET_SIZE = 12
+
+# The chi-square value that fair dice exceed with a probability of 1%,
+# for sides - 1 degrees of freedom.
+CHI_SQUARE_1_PERCENT = {6: 15.09, 20: 36.19, 50: 74.92}
+
+
+def chi_square(rolls, sides):
+    counts = [0] * (sides + 1)
+    for face in rolls:
+        counts[face] += 1
+    expected = len(rolls) / sides
+    return sum((n - expected) ** 2 / expected for n in counts[1:])
+
+
+def measure(backend, sides, rolls):
+    """Return the rolls per second when rolling sets of SET_SIZE dice,
+    the rolls per second of roll_bytes, and the bulk rolls.
+    """
+    sets = max(rolls // SET_SIZE // 10, 1)
+    start = time.perf_counter()
+    for _ in range(sets):
+        backend.roll(SET_SIZE, sides)
+    set_rate = sets * SET_SIZE / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    bulk = backend.roll_bytes(rolls, sides)
+    bulk_rate = rolls / (time.perf_counter() - start)
+    return set_rate, bulk_rate, bulk
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rolls", type=int, default=1_000_000,
+            help="how many dice each backend rolls at once")
+    parser.add_argument("--seed", type=int, default=2024)
+    parser.add_argument("--output", default="dice_rng_benchmark.json",
+            help="file where the JSON report is written")
+    args = parser.parse_args(argv)
+
+    report = {}
+    for name in BACKENDS:
+        try:
+            backend = get_backend(name, args.seed)
+        except ImportError as error:
+            print(f"{name:>8}: not available ({error})")
+            report[name] = None
+            continue
+        report[name] = {}
+        for sides in SIDES:
+            set_rate, bulk_rate, bulk = measure(backend, sides, args.rolls)
+            statistic = chi_square(bulk, sides)
+            report[name][sides] = {
+                "set_rolls_per_second": set_rate,
+                "bulk_rolls_per_second": bulk_rate,
+                "chi_square": statistic,
+            }
+            print(f"{name:>8} d{sides:<3} sets {set_rate:14,.0f}/s"
+                    f"  bulk {bulk_rate:14,.0f}/s"
+                    f"  chi-square {statistic:7.2f}"
+                    f" (1% limit {CHI_SQUARE_1_PERCENT[sides]})")
+
+    with open(args.output, "wt") as outfile:
+        json.dump(report, outfile, indent=2)
+    print(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""Statistics for a set of dice, that is count dice with the same
+number of sides, the way dice.py and dice-en.py define a set.
+
+sum_distribution computes the exact probability of every possible
+sum by convolving the distributions of the single dice. It counts
+with Python integers, so the result is exact even for 12 dice with
+50 sides, where there are 50**12 combinations.
+
+simulate_histogram rolls a set many times and counts how often each
+sum came up. The dice are rolled by a backend from dice_rng, chosen
+with the DICE_RNG environment variable like the rolls of the dice
+roller, in chunks of many dice at once, so only one chunk is ever in
+memory. If numpy is installed, each chunk is summed and counted as a
+whole array, so millions of sets take a fraction of a second;
+otherwise the sums are counted in Python, only more slowly.
+
+None of the functions here use tkinter. compute_in_background runs
+one of them on a worker thread and passes the result to a function
+in the tkinter thread, so a window doesn't freeze while it works.
+"""
+import bisect
+import queue
+import threading
+from functools import lru_cache
+
+import dice_rng
+import instrument
+from dice_worker import poll_queue
+
+DEFAULT_SIMULATED_SETS = 1_000_000
+DEFAULT_CHUNK_SIZE = 250_000
+DEFAULT_PERCENTILES = (5, 25, 50, 75, 95)
+
+
+def _check_set(count, sides):
+    if count < 1:
+        raise ValueError(f"count must be at least 1, not {count}")
+    if sides < 2:
+        raise ValueError(f"sides must be at least 2, not {sides}")
+
+
+@lru_cache(maxsize=256)
+def sum_counts(count, sides):
+    """Return a tuple ways where ways[s] is the number of the
+    sides**count possible rolls of count dice that add up to s.
+    """
+    _check_set(count, sides)
+    # One die with no sum yet, then one convolution for each die.
+    ways = [1]
+    for _ in range(count):
+        new_ways = [0] * (len(ways) + sides)
+        for total, n in enumerate(ways):
+            if n:
+                for face in range(1, sides + 1):
+                    new_ways[total + face] += n
+        ways = new_ways
+    return tuple(ways)
+
+
+def sum_distribution(count, sides):
+    """Return a list probabilities where probabilities[s] is the exact
+    probability that count dice with the given number of sides add up
+    to s. The entries for sums below count are 0.
+    """
+    ways = sum_counts(count, sides)
+    combinations = sides ** count
+    return [n / combinations for n in ways]
+
+
+def mean(count, sides):
+    """Return the expected sum of count dice."""
+    _check_set(count, sides)
+    return count * (sides + 1) / 2
+
+
+def percentiles(histogram, ranks=DEFAULT_PERCENTILES):
+    """Return a dict that maps each rank in ranks (0 to 100) to the
+    smallest sum s for which at least rank percent of the weights in
+    histogram are at sums up to s. histogram may contain counts, like
+    the result of simulate_histogram, or probabilities, like the
+    result of sum_distribution.
+    """
+    cumulative = []
+    total = 0
+    for weight in histogram:
+        total += weight
+        cumulative.append(total)
+    if total <= 0:
+        raise ValueError("the histogram is empty")
+    result = {}
+    for rank in ranks:
+        if not 0 <= rank <= 100:
+            raise ValueError(f"a percentile must be between 0 and 100, not {rank}")
+        index = bisect.bisect_left(cumulative, total * rank / 100)
+        result[rank] = min(index, len(histogram) - 1)
+    return result
+
+
+@instrument.timed()
+def simulate_histogram(count, sides, sets=DEFAULT_SIMULATED_SETS, seed=None,
+        chunk_size=DEFAULT_CHUNK_SIZE, backend=None):
+    """Roll count dice with the given number of sides sets times.
+    backend is a backend from dice_rng, or None for a new one from
+    dice_rng.get_backend with seed. A die can have at most
+    dice_rng.MAX_SIDES sides.
+    Return: a list histogram where histogram[s] is how many of the
+        sets added up to s
+    """
+    _check_set(count, sides)
+    if sets < 0:
+        raise ValueError(f"sets must not be negative, not {sets}")
+    assert chunk_size > 0, "chunk_size must be greater than 0"
+    if backend is None:
+        backend = dice_rng.get_backend(seed=seed)
+    try:
+        import numpy as np
+    except ImportError:
+        return _simulate_python(count, sides, sets, chunk_size, backend)
+
+    # The smallest type that holds one sum keeps each chunk small.
+    sum_type = np.uint16 if count * sides <= 65535 else np.int64
+    histogram = np.zeros(count * sides + 1, dtype=np.int64)
+    for start in range(0, sets, chunk_size):
+        rows = min(chunk_size, sets - start)
+        if hasattr(backend, "roll_array"):
+            rolls = backend.roll_array(rows * count, sides)
+        else:
+            rolls = np.frombuffer(backend.roll_bytes(rows * count, sides),
+                    dtype=np.uint8)
+        sums = rolls.reshape(rows, count).sum(axis=1, dtype=sum_type)
+        histogram += np.bincount(sums, minlength=len(histogram))
+    return histogram.tolist()
+
+
+def _simulate_python(count, sides, sets, chunk_size, backend):
+    histogram = [0] * (count * sides + 1)
+    for start in range(0, sets, chunk_size):
+        rows = min(chunk_size, sets - start)
+        rolls = backend.roll_bytes(rows * count, sides)
+        # zip takes count rolls at a time from the same iterator.
+        for total in map(sum, zip(*[iter(rolls)] * count)):
+            histogram[total] += 1
+    return histogram
+
+
+@instrument.timed()
+def summarize(count, sides, sets=DEFAULT_SIMULATED_SETS, seed=None,
+        ranks=DEFAULT_PERCENTILES):
+    """Simulate sets rolls of a set and compare them with the exact
+    distribution.
+    Return: a dict with the keys
+        count, sides, sets: the arguments
+        exact: the result of sum_distribution
+        simulated: the result of simulate_histogram
+        mean, simulated_mean: the exact and the simulated mean sum
+        percentiles, simulated_percentiles: dicts from percentiles
+    """
+    exact = sum_distribution(count, sides)
+    simulated = simulate_histogram(count, sides, sets, seed)
+    summary = {
+        "count": count,
+        "sides": sides,
+        "sets": sets,
+        "exact": exact,
+        "simulated": simulated,
+        "mean": mean(count, sides),
+        "percentiles": percentiles(exact, ranks),
+        "simulated_mean": None,
+        "simulated_percentiles": None,
+    }
+    if sets > 0:
+        summary["simulated_mean"] = sum(
+                total * n for total, n in enumerate(simulated)) / sets
+        summary["simulated_percentiles"] = percentiles(simulated, ranks)
+    return summary
+
+
+def compute_in_background(widget, on_done, function, *args, poll_ms=50):
+    """Call function(*args) on a worker thread. When it returns, call
+    on_done(result, None) in the tkinter thread. If it raises an
+    exception, call on_done(None, exception) instead. widget is any
+    tkinter widget; its after method checks for the result every
+    poll_ms milliseconds, because tkinter must not be used from the
+    worker thread.
+    """
+    results = queue.SimpleQueue()
+
+    def work():
+        try:
+            results.put((function(*args), None))
+        except Exception as error:
+            results.put((None, error))
+
+    threading.Thread(target=work, daemon=True).start()
+    poll_queue(widget, results, 1, lambda item: on_done(*item),
+            poll_ms=poll_ms)
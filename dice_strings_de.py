@@ -0,0 +1,30 @@
+"""Der deutsche Text des Würfel-Rollers, siehe dice_core.strings."""
+
+STRINGS = {
+    "title": "Dice Roller mit adaptiven Größen",
+    "error_title": "Fehler",
+    "input_error_title": "Input Error",
+    "invalid_set_count": "Bitte eine gültige Anzahl von Sets ({min_sets}-{max_sets}) eingeben.",
+    "invalid_set": "Bitte gültige Werte für Seiten ({min_sides}-{max_sides})"
+            " und Anzahl der Würfel ({min_dice}-{max_dice}) eingeben.",
+    "invalid_sets": "Bitte gültige Werte für Seiten ({min_sides}-{max_sides})"
+            " und Anzahl der Würfel ({min_dice}-{max_dice}) eingeben in: {names}",
+    "how_many_sets": "Wie viele Sets möchtest du würfeln? ({min_sets}-{max_sets})",
+    "next": "Weiter",
+    "confirm_settings": "Einstellungen bestätigen",
+    "set_name": "Set {number} Name:",
+    "default_set_name": "Set {number}",
+    "dice_count": "Anzahl Würfel (max. {max_dice}):",
+    "dice_sides": "Anzahl Seiten (max. {max_sides}):",
+    "dice_color": "Würfelfarbe:",
+    "number_color": "Zahlenfarbe:",
+    "choose": "Wählen",
+    "back_to_settings": "Zurück zu den Einstellungen",
+    "roll_all": "Alle würfeln",
+    "roll": "{name} - Würfeln",
+    "statistics": "Statistik",
+    "total": "Gesamtergebnis: {total}",
+    "simulating": "Simuliere {sets:,} Würfe...",
+    "simulation_failed": "Simulation fehlgeschlagen: {error}",
+    "simulation_result": "{sets:,} Würfe, Mittelwert {simulated_mean:.2f} (exakt {mean:.2f})\n{ranks}",
+}
@@ -0,0 +1,30 @@
+"""The English text of the dice roller, see dice_core.strings."""
+
+STRINGS = {
+    "title": "Dice Roller with Adaptive Sizes",
+    "error_title": "Error",
+    "input_error_title": "Input Error",
+    "invalid_set_count": "Please enter a valid number of sets ({min_sets}-{max_sets}).",
+    "invalid_set": "Please enter valid values for sides ({min_sides}-{max_sides})"
+            " and dice count ({min_dice}-{max_dice}).",
+    "invalid_sets": "Please enter valid values for sides ({min_sides}-{max_sides})"
+            " and dice count ({min_dice}-{max_dice}) in: {names}",
+    "how_many_sets": "How many sets do you want to roll? ({min_sets}-{max_sets})",
+    "next": "Next",
+    "confirm_settings": "Confirm Settings",
+    "set_name": "Set {number} Name:",
+    "default_set_name": "Set {number}",
+    "dice_count": "Dice Count (max. {max_dice}):",
+    "dice_sides": "Dice Sides (max. {max_sides}):",
+    "dice_color": "Dice Color:",
+    "number_color": "Number Color:",
+    "choose": "Choose",
+    "back_to_settings": "Back to Settings",
+    "roll_all": "Roll All",
+    "roll": "{name} - Roll Dice",
+    "statistics": "Statistics",
+    "total": "Total: {total}",
+    "simulating": "Simulating {sets:,} rolls...",
+    "simulation_failed": "Simulation failed: {error}",
+    "simulation_result": "{sets:,} rolls, mean {simulated_mean:.2f} (exact {mean:.2f})\n{ranks}",
+}
@@ -0,0 +1,128 @@
+"""Roll many sets of dice at once on worker threads.
+
+RollAllWorker rolls every set in a thread pool. Each worker also lets
+the renderer draw off screen whatever it can (see the prepare method
+of the renderers in dice_render), so the sets are rolled and drawn at
+the same time instead of one after another. tkinter must only be used
+from the thread that runs mainloop, so the workers put their results
+into a queue. The after method of a widget takes them out and passes
+them to a function in the tkinter thread, and each set is shown as
+soon as its own result is ready. poll_queue does that part, and
+dice_stats uses it too.
+
+The thread pool is started by the first roll_all, so creating a
+RollAllWorker when a window opens doesn't import concurrent.futures.
+"""
+import os
+import queue
+
+from dice_core import roll_set
+
+DEFAULT_POLL_MS = 15
+
+
+def poll_queue(widget, results, count, on_item, on_done=None,
+        poll_ms=DEFAULT_POLL_MS):
+    """In the tkinter thread, take count items out of the queue
+    results, which worker threads put them into, call on_item(item)
+    for each one as soon as it is there, and then call on_done(). The
+    after method of widget checks the queue every poll_ms milliseconds.
+    If on_item raises an exception, tkinter reports it, and the other
+    items are still taken and on_done is still called.
+    """
+    remaining = count
+
+    def poll():
+        nonlocal remaining
+        try:
+            while remaining:
+                try:
+                    item = results.get_nowait()
+                except queue.Empty:
+                    break
+                remaining -= 1
+                on_item(item)
+        finally:
+            if remaining:
+                widget.after(poll_ms, poll)
+            elif on_done is not None:
+                on_done()
+
+    widget.after(poll_ms, poll)
+
+
+class RollAllWorker:
+    """Rolls sets of dice in a thread pool and hands the rolls back to
+    the tkinter thread. widget is any tkinter widget that lives as long
+    as the worker, usually the main window, and renderer is the
+    renderer from dice_render that will draw the dice, or None.
+    """
+    def __init__(self, widget, renderer=None, max_workers=None,
+            poll_ms=DEFAULT_POLL_MS):
+        if max_workers is None:
+            max_workers = min(12, (os.cpu_count() or 1) + 4)
+        self.widget = widget
+        self.renderer = renderer
+        self.poll_ms = poll_ms
+        self.max_workers = max_workers
+        self.__executor = None
+        self.__results = queue.SimpleQueue()
+        self.__pending = 0
+        self.__on_result = None
+
+
+    @property
+    def busy(self):
+        """True while the sets of the last call to roll_all aren't all shown."""
+        return self.__pending > 0
+
+
+    def roll_all(self, sets, on_result, on_done=None):
+        """Roll the sets in sets, which is a list of tuples
+        (count, sides, dice_color, text_color, size).
+        For each set, call on_result(index, rolls, error) in the
+        tkinter thread as soon as it is rolled, where index is the
+        index of the set in sets and error is None or the exception
+        that rolling it raised. After the last set, call on_done().
+        """
+        if self.busy:
+            raise RuntimeError("the sets of the last roll aren't all shown yet")
+        self.__on_result = on_result
+        self.__pending = len(sets)
+        if not sets:
+            if on_done is not None:
+                on_done()
+            return
+        if self.__executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self.__executor = ThreadPoolExecutor(self.max_workers,
+                    thread_name_prefix="dice-roll")
+        for index, dice_set in enumerate(sets):
+            self.__executor.submit(self.__roll, index, *dice_set)
+        poll_queue(self.widget, self.__results, len(sets), self.__show,
+                on_done, self.poll_ms)
+
+
+    def __roll(self, index, count, sides, dice_color, text_color, size):
+        # Runs in a worker thread, so it must not use tkinter.
+        try:
+            rolls = roll_set(count, sides)
+            if self.renderer is not None:
+                self.renderer.prepare(rolls, sides, dice_color, text_color, size)
+            self.__results.put((index, rolls, None))
+        except Exception as error:
+            self.__results.put((index, None, error))
+
+
+    def __show(self, result):
+        # Count the set before showing it, so that busy is right even
+        # if on_result raises an exception.
+        self.__pending -= 1
+        index, rolls, error = result
+        self.__on_result(index, rolls, error)
+
+
+    def shutdown(self):
+        """Stop the worker threads after the sets that are being rolled."""
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=False)
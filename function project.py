@@ -1,41 +1,46 @@
-
-import math
+import instrument
+from windchill import UNITS, to_fahrenheit, wind_chill_table
 
 
 # function for windchill calculation in fahrenheit
-def windspeed_calculation_f ():
-    for speed in range (0, 60, 5 ):
-        speed += 5  
-        fah_cel == "F"
-        wind_chill = 35.74 + (0.6215*temperature) - (35.75* (speed**0.16)) + (0.4275*temperature*(speed**0.16))
-        print (f"At temperature {temperature}F, and wind speed at {speed}MPH. The windchill is: {wind_chill:.2f}F. ")
-        
+def windspeed_calculation_f (temperature):
+    print_wind_chill_table (temperature, "F")
+
 
 # function for windchll calculation if typed in celsius
-def windspeed_calculation_c ():
-    for speed in range (0, 60, 5 ):
-        speed += 5         
-        fah_cel == "C"
-          # calculation from celsius to fahrenheit
-        temperature_new = (temperature *1.8) + 32
-        wind_chill = 35.74 + (0.6215*temperature_new) - 35.75*(speed**0.16) + (0.4275*temperature_new *(speed**0.16))
-        print (f"At temperature {temperature_new}F, wind speed at {speed}MPH. The windchill is: {wind_chill:.2f}F")
-
-       
-temperature = float(input("What is the temperature? "))
-fah_cel = input ("Fahrenheit or Celsius (F/C)? " ).upper()
-print()
-
-# calling the functions and loop if no F or C
-while fah_cel != 'F''C':
-  if fah_cel.upper() == 'F':
-    windspeed_calculation_f ()
-    break
-  elif fah_cel.upper() == 'C':
-    windspeed_calculation_c ()
-    break
-  else:
-    fah_cel = input ("Fahrenheit or Celsius (F/C)? " ).upper()
-    
+def windspeed_calculation_c (temperature):
+    print_wind_chill_table (temperature, "C")
+
+
+# function for windchill calculation if typed in kelvin
+def windspeed_calculation_k (temperature):
+    print_wind_chill_table (temperature, "K")
+
+
+@instrument.timed()
+def print_wind_chill_table (temperature, unit):
+    # the table is always shown in fahrenheit
+    temperature_f = to_fahrenheit (temperature, unit)
+    for speed, wind_chill in wind_chill_table (temperature, unit, result_unit="F"):
+        print (f"At temperature {temperature_f}F, and wind speed at {speed}MPH. The windchill is: {wind_chill:.2f}F. ")
+
+
+def main ():
+    temperature = float(input("What is the temperature? "))
+    fah_cel = input ("Fahrenheit, Celsius or Kelvin (F/C/K)? " ).upper()
+
+    # ask again until the unit is F, C or K
+    while fah_cel not in UNITS:
+        fah_cel = input ("Fahrenheit, Celsius or Kelvin (F/C/K)? " ).upper()
+    print()
+
+    if fah_cel == 'F':
+        windspeed_calculation_f (temperature)
+    elif fah_cel == 'C':
+        windspeed_calculation_c (temperature)
+    else:
+        windspeed_calculation_k (temperature)
 
 
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""Timers and counters for the programs in this repository, switched
+on with environment variables, so that they cost nothing otherwise.
+
+    INSTRUMENT         a comma separated list of what to measure:
+                       "time" (timers and counters), "profile" (also
+                       run cProfile), and "memory" (also trace memory
+                       allocations with tracemalloc). "1" means "time".
+                       If it isn't set or empty, nothing is measured.
+    INSTRUMENT_REPORT  the file where the JSON report is written when
+                       the program ends, instrument_report.json by
+                       default. With "profile", the cProfile data is
+                       written next to it, with the extension .prof.
+
+Use timed as a decorator for a function, timer as a with statement
+around a block, and count to count events:
+
+    @instrument.timed()
+    def read_dictionary(filename, key_column_index): ...
+
+    with instrument.timer("students.lookup"):
+        ...
+    instrument.count("dice.rolls", len(rolls))
+
+When INSTRUMENT isn't set, timed returns the function itself without
+a wrapper, timer returns one shared object that does nothing, and
+count does nothing, so instrumented code runs at its normal speed.
+The variables are read when this module is first imported.
+"""
+import atexit
+import functools
+import os
+import threading
+import time
+
+_settings = {word.strip().lower()
+        for word in os.environ.get("INSTRUMENT", "").split(",") if word.strip()}
+if "1" in _settings:
+    _settings.add("time")
+if _settings & {"profile", "memory"}:
+    _settings.add("time")
+
+ENABLED = "time" in _settings
+PROFILE = "profile" in _settings
+MEMORY = "memory" in _settings
+REPORT_PATH = os.environ.get("INSTRUMENT_REPORT", "instrument_report.json")
+
+# For each timer name: [calls, total ns, min ns, max ns]
+_timers = {}
+_counters = {}
+# Timed functions may run on worker threads.
+_lock = threading.Lock()
+
+
+def enabled():
+    """Return True if timers and counters are recorded."""
+    return ENABLED
+
+
+def _record(name, elapsed):
+    with _lock:
+        stats = _timers.get(name)
+        if stats is None:
+            _timers[name] = [1, elapsed, elapsed, elapsed]
+        else:
+            stats[0] += 1
+            stats[1] += elapsed
+            if elapsed < stats[2]:
+                stats[2] = elapsed
+            if elapsed > stats[3]:
+                stats[3] = elapsed
+
+
+def timed(name=None):
+    """Return a decorator that times every call of a function under
+    name, or under the module and name of the function if name is None.
+    """
+    def decorator(function):
+        if not ENABLED:
+            return function
+        timer_name = name or f"{function.__module__}.{function.__qualname__}"
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter_ns()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                _record(timer_name, time.perf_counter_ns() - start)
+        return wrapper
+    return decorator
+
+
+class _Timer:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        _record(self.name, time.perf_counter_ns() - self.start)
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+_NULL_TIMER = _NullTimer()
+
+
+def timer(name):
+    """Return a context manager that times the block of a with statement."""
+    return _Timer(name) if ENABLED else _NULL_TIMER
+
+
+def count(name, n=1):
+    """Add n to the counter called name."""
+    if ENABLED:
+        with _lock:
+            _counters[name] = _counters.get(name, 0) + n
+
+
+def report():
+    """Return everything that was measured so far as a dict."""
+    timers = {}
+    for name, (calls, total, fastest, slowest) in sorted(_timers.items()):
+        timers[name] = {
+            "calls": calls,
+            "total_ms": total / 1e6,
+            "mean_us": total / calls / 1e3,
+            "min_us": fastest / 1e3,
+            "max_us": slowest / 1e3,
+        }
+    result = {"timers": timers, "counters": dict(sorted(_counters.items()))}
+    if MEMORY and tracemalloc.is_tracing():
+        current, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+        result["memory"] = {
+            "current_bytes": current,
+            "peak_bytes": peak,
+            "top": [{"where": str(stat.traceback), "bytes": stat.size,
+                    "blocks": stat.count}
+                    for stat in snapshot.statistics("lineno")[:10]],
+        }
+    return result
+
+
+def write_report(path=None):
+    """Write the report to path, or to INSTRUMENT_REPORT, as JSON."""
+    # json is only needed at the end, so it isn't imported with this module.
+    import json
+    if path is None:
+        path = REPORT_PATH
+    data = report()
+    if PROFILE:
+        _profiler.disable()
+        profile_path = os.path.splitext(path)[0] + ".prof"
+        _profiler.dump_stats(profile_path)
+        data["profile"] = _profile_summary(profile_path)
+    with open(path, "wt") as outfile:
+        json.dump(data, outfile, indent=2)
+
+
+def _profile_summary(profile_path, limit=20):
+    """Return the functions with the largest cumulative time."""
+    stats = pstats.Stats(profile_path)
+    rows = []
+    for (filename, line, function), (_, calls, total, cumulative, _) \
+            in stats.stats.items():
+        rows.append({"function": f"{filename}:{line}({function})",
+                "calls": calls, "total_s": total, "cumulative_s": cumulative})
+    rows.sort(key=lambda row: row["cumulative_s"], reverse=True)
+    return {"file": profile_path, "top": rows[:limit]}
+
+
+if MEMORY:
+    import tracemalloc
+    tracemalloc.start()
+if PROFILE:
+    import cProfile
+    import pstats
+    _profiler = cProfile.Profile()
+    _profiler.enable()
+if ENABLED:
+    atexit.register(write_report)
@@ -0,0 +1,61 @@
+"""Scroll a widget with the mouse wheel.
+
+Tk sends mouse wheel events to the widget under the mouse pointer,
+which is usually a label or an entry inside the frame that should
+scroll. So bind_mouse_wheel binds the wheel for all widgets and only
+scrolls when the widget under the pointer is inside the frame. On
+Windows and macOS the wheel sends <MouseWheel> events; on X11 it
+presses the buttons 4 and 5.
+
+A binding for all widgets outlives the widget that made it, so when
+the frame is destroyed, bind_mouse_wheel removes its own bindings and
+leaves those of other frames alone.
+"""
+
+WHEEL_SEQUENCES = ("<MouseWheel>", "<Button-4>", "<Button-5>")
+
+
+def _is_inside(widget, container):
+    """Return True if widget is container or a widget inside it."""
+    while widget is not None and widget is not container:
+        widget = getattr(widget, "master", None)
+    return widget is not None
+
+
+def _unbind_all(widget, sequence, funcid):
+    """Remove the function funcid from the bindings of sequence for
+    all widgets. Misc.unbind_all would remove every function that is
+    bound to sequence, not only this one.
+    """
+    script = widget.tk.call("bind", "all", sequence)
+    prefix = f'if {{"[{funcid} '
+    kept = "\n".join(line for line in script.split("\n")
+            if not line.startswith(prefix))
+    widget.tk.call("bind", "all", sequence, kept if kept.strip() else "")
+    widget.deletecommand(funcid)
+
+
+def bind_mouse_wheel(widget, scroll):
+    """When the mouse wheel turns over widget or any widget inside it,
+    call scroll(-1) to scroll up or scroll(1) to scroll down. The
+    bindings are removed when widget is destroyed.
+    """
+    def wheel(event):
+        if not _is_inside(event.widget, widget):
+            return
+        if event.num == 4 or event.delta > 0:
+            scroll(-1)
+        elif event.num == 5 or event.delta < 0:
+            scroll(1)
+
+    funcids = {sequence: widget.bind_all(sequence, wheel, add="+")
+            for sequence in WHEEL_SEQUENCES}
+
+    def unbind(event):
+        # Widgets inside a Toplevel send their <Destroy> to it too.
+        if str(event.widget) != str(widget):
+            return
+        for sequence, funcid in funcids.items():
+            _unbind_all(widget, sequence, funcid)
+
+    widget.bind("<Destroy>", unbind, add="+")
@@ -1,48 +1,61 @@
 # Copyright 2020, Brigham Young University-Idaho. All rights reserved.
 
-"""This module contains two classes, IntEntry and FloatEntry, that allow
-a user to enter an integer or a floating-point number into a tkinter
-Entry widget.
+"""This module contains four classes, IntEntry, FloatEntry, DecimalEntry,
+and BigIntEntry, that allow a user to enter an integer, a floating-point
+number, an exact decimal number, or an integer with any number of digits
+into a tkinter Entry widget. The rules that decide which keystrokes are allowed
+are in the number_validation module, which doesn't need tkinter.
 """
 import tkinter as tk
 from tkinter import Entry
+from decimal import Decimal
 from numbers import Number
 from sys import float_info
+from number_validation import IntValidator, FloatValidator, \
+        DecimalValidator, BigIntValidator
 
 
 class _NumberEntry(Entry):
     _ERROR_STYLE = {"bg":"pink", "fg":"black"}
 
 
-    def __init__(self, parent, datatype, dataname,
+    def __init__(self, parent, datatype, dataname, validator,
             lower_bound, upper_bound, default, kwargs):
         super().__init__(parent)
 
         assert type(self) != _NumberEntry, \
             "can't create a _NumberEntry object; " \
             "only children classes of _NumberEntry can be instantiated"
-        assert isinstance(lower_bound, datatype), \
+        # Only DecimalEntry and BigIntEntry allow
+        # None, which means there is no bound.
+        assert lower_bound is None or isinstance(lower_bound, datatype), \
             f"lower_bound must be " + dataname
-        assert isinstance(upper_bound, datatype), \
+        assert upper_bound is None or isinstance(upper_bound, datatype), \
             f"upper_bound must be " + dataname
-        assert lower_bound < upper_bound, \
+        assert lower_bound is None or upper_bound is None \
+            or lower_bound < upper_bound, \
             "lower_bound must be less than upper_bound"
 
         self.__datatype = datatype
         self.__dataname = dataname
         self.__lower_bound = lower_bound
         self.__upper_bound = upper_bound
+        self._validator = validator
 
         if default is not None:
             assert isinstance(default, datatype), \
                 f"default must be " + dataname
             assert self._in_bounds(default), \
                 "default must be between lower_bound and upper_bound"
+            text = self._to_text(default)
+            assert self._validator.is_valid(text), \
+                f"default must be a number that the user could type, not {text}"
             self.delete(0, tk.END)
-            self.insert(0, str(default))
+            self.insert(0, text)
 
         self.__set_tk_args(kwargs)
         self.bind("<FocusIn>", _NumberEntry.__select_all)
+        self.bind("<FocusIn>", _NumberEntry.__rearm_validation, add="+")
 
 
     def __set_tk_args(self, kwargs):
@@ -50,14 +63,26 @@ class _NumberEntry(Entry):
         if "justify" not in kwargs:
             kwargs["justify"] = "right"
         if "width" not in kwargs:
-            kwargs["width"] = \
-                max(len(str(self.__lower_bound)), len(str(self.__upper_bound)))
+            kwargs["width"] = max(len(self._to_text(bound)) if bound is not None
+                    else 20 for bound in (self.__lower_bound, self.__upper_bound))
         kwargs["validate"] = "focusin"
         kwargs["validatecommand"] = \
-                (self.register(self.__validate_all), "%V", "%s", "%P")
+                (self.register(self.__validate_all),
+                "%V", "%s", "%P", "%d", "%i", "%S")
         self.config(**kwargs)
         self._original_style = {"bg":self["bg"], "fg":self["fg"]}
 
+        # Remember the colors and the validate mode that were last sent
+        # to Tk, so that validation only reconfigures the widget when
+        # they change.
+        self.__shows_valid = True
+        self.__validate_mode = "focusin"
+
+        # Counters that show how many Tcl round trips the
+        # validation of this entry has caused.
+        self.validation_count = 0
+        self.tcl_call_count = 0
+
 
     # Each time a _NumberEntry gets the keyboard focus,
     # select all the text in that entry.
@@ -69,20 +94,51 @@ class _NumberEntry(Entry):
         entry.icursor(tk.END)
 
 
+    # Tk sets validate to none by itself when the validatecommand
+    # raises an error, after which it never calls the validatecommand
+    # again, so focus changes can't turn validation back on. This
+    # binding does that each time the entry gets the keyboard focus,
+    # and it is the only place where the mode is read back from Tk.
     @staticmethod
-    def _contains_space(text):
-        has_space = False
-        for ch in text:
-            has_space = ch.isspace()
-            if has_space:
-                break
-        return has_space
+    def __rearm_validation(event):
+        entry = event.widget
+        entry.tcl_call_count += 1
+        entry.__validate_mode = entry["validate"]
+        if entry.__validate_mode == "none":
+            entry.__set_validate("all")
+
+
+    def __set_validate(self, mode):
+        if mode != self.__validate_mode:
+            self.__validate_mode = mode
+            self.tcl_call_count += 1
+            self.config({"validate": mode})
+
 
+    def __show_valid(self, valid):
+        if valid != self.__shows_valid:
+            self.__shows_valid = valid
+            self.tcl_call_count += 1
+            self.config(self._original_style if valid
+                    else _NumberEntry._ERROR_STYLE)
 
-    def __validate_all(self, reason, current_text, text_if_allowed):
+
+    def tcl_calls_per_validation(self):
+        """Return the average number of Tcl calls that were made
+        each time a keystroke or focus change was validated.
+        """
+        if self.validation_count == 0:
+            return 0.0
+        return self.tcl_call_count / self.validation_count
+
+
+    def __validate_all(self, reason, current_text, text_if_allowed,
+            action, index, changed):
+        self.validation_count += 1
         valid = False
         if reason == "key":
-            valid = self._validate_key(current_text, text_if_allowed)
+            valid = self._validate_key(current_text, text_if_allowed,
+                    int(action), int(index), changed)
         elif reason == "focusin":
             valid = self.__focus_in(current_text)
         elif reason == "focusout":
@@ -91,27 +147,34 @@ class _NumberEntry(Entry):
 
 
     def __focus_in(self, current_text):
-        self.config({"validate": "all"})
+        self.__set_validate("all")
         return self.__validate_focus(current_text)
 
     def __focus_out(self, current_text):
-        self.config({"validate": "focusin"})
+        self.__set_validate("focusin")
         return self.__validate_focus(current_text)
 
     def __validate_focus(self, current_text):
-        valid = False
-        try:
-            n = self._convert(current_text)
-            valid = self._in_bounds(n)
-        except ValueError:
-            pass
-        style = self._original_style if valid else _NumberEntry._ERROR_STYLE
-        self.config(style)
+        valid = self._validator.is_valid(current_text)
+        self.__show_valid(valid)
         return valid
 
 
+    def _validate_key(self, current_text, text_if_allowed,
+            action=-1, index=-1, changed=""):
+        allowed, valid = self._validator.validate_key(
+                current_text, text_if_allowed, action, index, changed)
+        self.__show_valid(valid)
+        return allowed
+
+
     def _in_bounds(self, n):
-        return self.__lower_bound <= n <= self.__upper_bound
+        return ((self.__lower_bound is None or self.__lower_bound <= n) and
+                (self.__upper_bound is None or n <= self.__upper_bound))
+
+
+    @staticmethod
+    def _to_text(n): return str(n)
 
 
     def set(self, n):
@@ -120,8 +183,14 @@ class _NumberEntry(Entry):
             "n must be " + self.__dataname
         assert self._in_bounds(n), \
             f"n must be between {self.__lower_bound} and {self.__upper_bound}"
+        # A number can be between the bounds and still be rejected by
+        # the entry, like 1.005 in a DecimalEntry with places=2, and get
+        # couldn't read it back.
+        text = self._to_text(n)
+        assert self._validator.is_valid(text), \
+            f"n must be a number that the user could type, not {text}"
         self.delete(0, tk.END)
-        self.insert(0, str(n))
+        self.insert(0, text)
 
 
     def get(self):
@@ -134,11 +203,22 @@ class _NumberEntry(Entry):
 
 
     def clear(self):
-        self.config({"validate": "focusin"})
-        self.config(self._original_style)
+        self.__set_validate("focusin")
+        self.__show_valid(True)
         self.delete(0, tk.END)
 
 
+    def show_text(self, text):
+        """Display text as if the user had typed it, without changing
+        when keystrokes are validated, so an entry that has the keyboard
+        focus keeps rejecting letters. If text isn't empty and isn't a
+        valid number, show the entry in the error colors.
+        """
+        self.delete(0, tk.END)
+        self.insert(0, text)
+        self.__show_valid(text == "" or self._validator.is_valid(text))
+
+
 class IntEntry(_NumberEntry):
     """An Entry widget that accepts only integers between
     an optional lower bound and an optional upper bound.
@@ -146,40 +226,9 @@ class IntEntry(_NumberEntry):
     def __init__(self, parent, *, lower_bound=-2**63,
             upper_bound=2**63 - 1, default=None, **kwargs):
         super().__init__(parent, int, "an integer",
+                IntValidator(lower_bound, upper_bound),
                 lower_bound, upper_bound, default, kwargs)
 
-        self.__lower_entry = lower_bound if lower_bound <= 1 else 1
-        self.__upper_entry = upper_bound if upper_bound >= -1 else -1
-        self.__allow_negative = (lower_bound < 0)
-
-
-    def _validate_key(self, current_text, text_if_allowed):
-        allowed = valid = False
-        try:
-            if not _NumberEntry._contains_space(text_if_allowed):
-                n = int(text_if_allowed)
-                allowed = self.__lower_entry <= n <= self.__upper_entry
-                # If text_if_allowed is allowed, we must allow it, and
-                # we must check only text_if_allowed for validity.
-                if allowed:
-                    valid = self._in_bounds(n)
-        except ValueError:
-            allowed = (len(text_if_allowed) == 0 or
-                    (self.__allow_negative and text_if_allowed == "-"))
-
-        # If text_if_allowed is not allowed, we must not allow
-        # it, and we must check only current_text for validity.
-        if not allowed:
-            try:
-                n = int(current_text)
-                valid = self._in_bounds(n)
-            except ValueError:
-                pass
-
-        style = self._original_style if valid else _NumberEntry._ERROR_STYLE
-        self.config(style)
-        return allowed
-
 
     @staticmethod
     def _convert(text): return int(text)
@@ -192,59 +241,61 @@ class FloatEntry(_NumberEntry):
     def __init__(self, parent, *, lower_bound=-float_info.max,
             upper_bound=float_info.max, default=None, **kwargs):
         super().__init__(parent, Number, "a number",
+                FloatValidator(lower_bound, upper_bound),
                 lower_bound, upper_bound, default, kwargs)
 
-        if lower_bound < 0:    # [-, 0)
-            self.__lower_entry = lower_bound
-        elif lower_bound < 1:  # [0, 1)
-            self.__lower_entry = 0
-        else:                  # [1, +]
-            self.__lower_entry = 1
-
-        if upper_bound <= -1:   # [-, -1]
-            self.__upper_entry = -1
-        elif upper_bound <= 0:  # (-1, 0]
-            self.__upper_entry = 0
-        else:                   # (0, +]
-            self.__upper_entry = upper_bound
-
-        self.__allow_negative = (lower_bound < 0)
-        self.__allow_leading_dot = (
-                (-1 < lower_bound < 1) or
-                (-1 < upper_bound < 1) or
-                (lower_bound <= -1 and 1 <= upper_bound))
-
-
-    def _validate_key(self, current_text, text_if_allowed):
-        allowed = valid = False
-        try:
-            if not _NumberEntry._contains_space(text_if_allowed):
-                n = float(text_if_allowed)
-                allowed = self.__lower_entry <= n <= self.__upper_entry
-                # If text_if_allowed is allowed, we must allow it, and
-                # we must check only text_if_allowed for validity.
-                if allowed:
-                    valid = self._in_bounds(n)
-        except ValueError:
-            allowed = (len(text_if_allowed) == 0 or
-                    (self.__allow_negative and text_if_allowed == "-") or
-                    (self.__allow_leading_dot and text_if_allowed == ".") or
-                    (self.__allow_negative and self.__allow_leading_dot
-                        and text_if_allowed == "-."))
-
-        # If text_if_allowed is not allowed, we must not allow
-        # it, and we must check only current_text for validity.
-        if not allowed:
-            try:
-                n = float(current_text)
-                valid = self._in_bounds(n)
-            except ValueError:
-                pass
-
-        style = self._original_style if valid else _NumberEntry._ERROR_STYLE
-        self.config(style)
-        return allowed
-
 
     @staticmethod
     def _convert(text): return float(text)
+
+
+class DecimalEntry(_NumberEntry):
+    """An Entry widget that accepts only exact decimal numbers, like
+    the amounts of money in a budget, between an optional lower bound
+    and an optional upper bound. If places is not None, the user can
+    type at most places digits after the decimal point. get returns
+    a Decimal.
+    """
+    def __init__(self, parent, *, lower_bound=None, upper_bound=None,
+            places=None, default=None, **kwargs):
+        super().__init__(parent, Decimal, "a Decimal",
+                DecimalValidator(lower_bound, upper_bound, places),
+                lower_bound, upper_bound, default, kwargs)
+
+
+    def _convert(self, text):
+        n = self._validator.parse(text)
+        if n is None:
+            raise ValueError(f"invalid decimal number: {text!r}")
+        return n
+
+
+    # Show numbers like Decimal("1E+2") as 100, which the user could type.
+    @staticmethod
+    def _to_text(n): return format(n, "f")
+
+
+class BigIntEntry(_NumberEntry):
+    """An Entry widget that accepts only integers between an optional
+    lower bound and an optional upper bound. Unlike IntEntry, it has no
+    bounds unless they are given, and the integers can have any number
+    of digits.
+    """
+    def __init__(self, parent, *, lower_bound=None, upper_bound=None,
+            default=None, **kwargs):
+        super().__init__(parent, int, "an integer",
+                BigIntValidator(lower_bound, upper_bound),
+                lower_bound, upper_bound, default, kwargs)
+
+
+    def _convert(self, text):
+        n = self._validator.parse(text)
+        if n is None:
+            raise ValueError(f"invalid integer: {text!r}")
+        return n
+
+
+    # str() refuses to convert integers with more than about
+    # 4300 digits, but converting a Decimal has no such limit.
+    @staticmethod
+    def _to_text(n): return str(Decimal(n))
@@ -0,0 +1,192 @@
+"""Replay keystrokes into IntEntry, FloatEntry, DecimalEntry, and
+BigIntEntry widgets, check which keystrokes they accept and which
+style they show, and measure how long validation takes per keystroke.
+
+Each keystroke is timed around the insert or delete that types it, so
+the time includes the call of the validatecommand from Tcl, the
+dispatch in the entry, and the way back to Tk, not only the
+validation rules.
+
+The harness needs a display. If none is set, it starts Xvfb (the X
+virtual framebuffer) for as long as it runs, so it also works on a
+server without a screen.
+
+Example:
+    python number_entry_harness.py --repeat 2000 --output report.json
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+import tkinter as tk
+from decimal import Decimal
+
+from number_entry import IntEntry, FloatEntry, DecimalEntry, BigIntEntry
+
+BACKSPACE = "\b"
+
+# Each case is (name, entry class, options, keystrokes,
+# expected text, expected validity after the last keystroke).
+CASES = [
+    ("int in range", IntEntry, {"lower_bound": 1, "upper_bound": 12},
+        "12", "12", True),
+    ("int too large", IntEntry, {"lower_bound": 1, "upper_bound": 12},
+        "13", "1", True),
+    ("int below lower bound", IntEntry, {"lower_bound": 10, "upper_bound": 50},
+        "5", "5", False),
+    ("int rejects letters", IntEntry, {"lower_bound": 1, "upper_bound": 12},
+        "1a", "1", True),
+    ("int negative sign", IntEntry, {"lower_bound": -10, "upper_bound": 10},
+        "-", "-", False),
+    ("int no negative sign", IntEntry, {"lower_bound": 0, "upper_bound": 10},
+        "-", "", False),
+    ("int backspace", IntEntry, {"lower_bound": 1, "upper_bound": 50},
+        "45" + BACKSPACE, "4", True),
+    ("float leading dot", FloatEntry, {"lower_bound": 0.0, "upper_bound": 1.0},
+        ".5", ".5", True),
+    ("float negative dot", FloatEntry, {"lower_bound": -1.0, "upper_bound": 1.0},
+        "-.", "-.", False),
+    ("float rejects space", FloatEntry, {},
+        "1 ", "1", True),
+    ("decimal places", DecimalEntry,
+        {"lower_bound": Decimal(0), "upper_bound": Decimal(1000), "places": 2},
+        "12.505", "12.50", True),
+    ("decimal too large", DecimalEntry,
+        {"lower_bound": Decimal(0), "upper_bound": Decimal(1000)},
+        "10000", "1000", True),
+    ("big int", BigIntEntry, {"lower_bound": 0},
+        "9" * 5000, "9" * 5000, True),
+]
+
+
+def start_virtual_display():
+    """If there is no display, start Xvfb and return its process."""
+    if sys.platform in ("win32", "darwin") or os.environ.get("DISPLAY"):
+        return None
+    xvfb = shutil.which("Xvfb")
+    if xvfb is None:
+        sys.exit("There is no display and Xvfb isn't installed. Set DISPLAY"
+                " or install Xvfb, on Debian and Ubuntu the xvfb package.")
+    display = f":{os.getpid() % 1000 + 100}"
+    process = subprocess.Popen([xvfb, display, "-screen", "0", "1024x768x24",
+            "-nolisten", "tcp"], stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL)
+    os.environ["DISPLAY"] = display
+    # Wait until Xvfb accepts connections.
+    for _ in range(50):
+        try:
+            tk.Tk().destroy()
+            return process
+        except tk.TclError:
+            time.sleep(0.1)
+    process.terminate()
+    sys.exit("Xvfb didn't start.")
+
+
+def type_keys(root, entry, keys, durations):
+    """Type keys into entry the way the user would, one at a time,
+    and add the time each keystroke took, with its validation, to
+    durations.
+    """
+    for key in keys:
+        if key == BACKSPACE:
+            end = entry.index(tk.INSERT)
+            if end == 0:
+                continue
+            start = time.perf_counter()
+            entry.delete(end - 1)
+        else:
+            start = time.perf_counter()
+            entry.insert(tk.INSERT, key)
+        durations.append(time.perf_counter() - start)
+    root.update_idletasks()
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return None
+    index = min(int(fraction * len(sorted_values)), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def run_case(root, case, repeat):
+    name, entry_class, options, keys, expected_text, expected_valid = case
+    entry = entry_class(root, **options)
+    entry.pack()
+    root.update()
+    entry.focus_force()
+    root.update()
+
+    durations = []
+    failures = []
+    # Keystrokes are only validated while the entry has the focus.
+    if entry["validate"] != "all":
+        failures.append("the entry didn't get the keyboard focus")
+
+    # Long streams are replayed fewer times.
+    replays = 0 if failures else max(1, min(repeat, 20_000 // len(keys)))
+    for _ in range(replays):
+        entry.delete(0, tk.END)
+        type_keys(root, entry, keys, durations)
+        text = tk.Entry.get(entry)
+        valid = entry["bg"] != entry._ERROR_STYLE["bg"]
+        if text != expected_text:
+            failures.append(f"text is {text[:40]!r}, expected {expected_text[:40]!r}")
+        if valid != expected_valid:
+            failures.append(f"valid is {valid}, expected {expected_valid}")
+        if failures:
+            break
+
+    durations.sort()
+    result = {
+        "keystrokes": len(durations),
+        "p50_us": percentile(durations, 0.50) * 1e6 if durations else None,
+        "p99_us": percentile(durations, 0.99) * 1e6 if durations else None,
+        "tcl_calls_per_validation": entry.tcl_calls_per_validation(),
+        "failures": failures,
+    }
+    entry.destroy()
+    return name, result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=200,
+            help="how many times each keystroke stream is replayed")
+    parser.add_argument("--output", default="number_entry_harness.json",
+            help="file where the JSON report is written")
+    args = parser.parse_args(argv)
+
+    xvfb = start_virtual_display()
+    try:
+        root = tk.Tk()
+        report = {}
+        for case in CASES:
+            name, result = run_case(root, case, args.repeat)
+            report[name] = result
+            status = "FAIL" if result["failures"] else "ok"
+            if result["keystrokes"]:
+                print(f"{status:>4} {name:<24} p50 {result['p50_us']:8.1f} us"
+                        f"  p99 {result['p99_us']:8.1f} us"
+                        f"  {result['tcl_calls_per_validation']:.2f} Tcl calls"
+                        " per validation")
+            else:
+                print(f"{status:>4} {name:<24}")
+            for failure in result["failures"]:
+                print(f"       {failure}")
+        root.destroy()
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+
+    with open(args.output, "wt") as outfile:
+        json.dump(report, outfile, indent=2)
+    print(f"Report written to {args.output}")
+    return 1 if any(result["failures"] for result in report.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
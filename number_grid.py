@@ -0,0 +1,244 @@
+"""This module contains the NumberGrid class, a scrollable table of
+IntEntry or FloatEntry widgets for forms with very many rows.
+
+A NumberGrid creates widgets only for the rows that fit on the
+screen. When the user scrolls, the same widgets are reused to show
+other rows. The numbers themselves are stored in a compact array
+(array("q") for integers and array("d") for floats), so a grid with
+a million rows needs about eight bytes per number instead of one
+tkinter widget per number.
+
+Text that isn't a number between the bounds, like "-" or "1e" that the
+user hasn't finished, leaves the cell empty. The text itself is kept
+and shown again in the error colors when its row is scrolled back into
+view, and invalid_cells lists these cells.
+"""
+from tkinter import Frame, Label, Scrollbar, Entry
+from array import array
+from sys import float_info
+
+from mouse_wheel import bind_mouse_wheel
+from number_entry import IntEntry, FloatEntry
+
+
+class NumberGrid(Frame):
+    """A grid of numbers with row_count rows and column_count columns
+    that shows visible_rows rows at a time.
+    """
+    def __init__(self, parent, row_count, column_count, *, datatype=int,
+            lower_bound=None, upper_bound=None, visible_rows=20,
+            column_names=None, **kwargs):
+        super().__init__(parent, **kwargs)
+
+        assert datatype in (int, float), "datatype must be int or float"
+        assert row_count >= 0, "row_count must not be negative"
+        assert column_count > 0, "column_count must be greater than 0"
+        assert visible_rows > 0, "visible_rows must be greater than 0"
+
+        if datatype is int:
+            typecode, entry_class = "q", IntEntry
+            if lower_bound is None:
+                lower_bound = -2**63
+            if upper_bound is None:
+                upper_bound = 2**63 - 1
+            assert -2**63 <= lower_bound and upper_bound <= 2**63 - 1, \
+                "the bounds of an int NumberGrid must fit in 64 bits"
+        else:
+            typecode, entry_class = "d", FloatEntry
+            if lower_bound is None:
+                lower_bound = -float_info.max
+            if upper_bound is None:
+                upper_bound = float_info.max
+
+        self.row_count = row_count
+        self.column_count = column_count
+        self.__typecode = typecode
+        self.__lower_bound = lower_bound
+        self.__upper_bound = upper_bound
+
+        # The numbers for all rows. A cell that has no number
+        # has 0 in __values and 0 in __filled.
+        self.__values = array(typecode, bytes(row_count * column_count
+                * array(typecode).itemsize))
+        self.__filled = bytearray(row_count * column_count)
+        # The text of the cells whose text isn't a number.
+        self.__invalid_text = {}
+
+        self.__visible_rows = min(visible_rows, max(row_count, 1))
+        self.__first_row = 0
+
+        if column_names is not None:
+            assert len(column_names) == column_count, \
+                "column_names must have one name for each column"
+            for column, name in enumerate(column_names):
+                Label(self, text=name).grid(row=0, column=column + 1)
+
+        # The widgets that are reused for whichever rows are visible.
+        self.__row_labels = []
+        self.__entries = []
+        for i in range(self.__visible_rows):
+            row_label = Label(self, anchor="e", width=len(str(row_count)))
+            row_label.grid(row=i + 1, column=0, sticky="e")
+            self.__row_labels.append(row_label)
+            row_entries = []
+            for column in range(column_count):
+                entry = entry_class(self, lower_bound=lower_bound,
+                        upper_bound=upper_bound)
+                entry.grid(row=i + 1, column=column + 1)
+                entry.bind("<FocusOut>", self.__store_entry, add="+")
+                row_entries.append(entry)
+            self.__entries.append(row_entries)
+
+        self.__scrollbar = Scrollbar(self, orient="vertical",
+                command=self.__scroll_command)
+        self.__scrollbar.grid(row=1, column=column_count + 1,
+                rowspan=self.__visible_rows, sticky="ns")
+
+        bind_mouse_wheel(self,
+                lambda rows: self.scroll_to(self.__first_row + rows))
+
+        self.__show(0)
+
+
+    def __index(self, row, column):
+        assert 0 <= row < self.row_count, \
+            f"row must be between 0 and {self.row_count - 1}"
+        assert 0 <= column < self.column_count, \
+            f"column must be between 0 and {self.column_count - 1}"
+        return row * self.column_count + column
+
+
+    def __store(self, row, column, entry):
+        """Copy the number in entry into the array."""
+        index = self.__index(row, column)
+        try:
+            self.__values[index] = entry.get()
+            self.__filled[index] = 1
+            self.__invalid_text.pop(index, None)
+        except ValueError:
+            self.__values[index] = 0
+            self.__filled[index] = 0
+            # Keep what the user typed, so it isn't lost without a word.
+            text = Entry.get(entry).strip()
+            if text:
+                self.__invalid_text[index] = text
+            else:
+                self.__invalid_text.pop(index, None)
+
+
+    def __store_entry(self, event):
+        for i, row_entries in enumerate(self.__entries):
+            if event.widget in row_entries:
+                row = self.__first_row + i
+                if row < self.row_count:
+                    self.__store(row, row_entries.index(event.widget),
+                            event.widget)
+                break
+
+
+    def __store_visible(self):
+        for i, row_entries in enumerate(self.__entries):
+            row = self.__first_row + i
+            if row >= self.row_count:
+                break
+            for column, entry in enumerate(row_entries):
+                self.__store(row, column, entry)
+
+
+    def __show(self, first_row):
+        """Show the rows that start at first_row in the reused widgets."""
+        last_first = max(self.row_count - self.__visible_rows, 0)
+        first_row = min(max(first_row, 0), last_first)
+        self.__first_row = first_row
+
+        for i, row_entries in enumerate(self.__entries):
+            row = first_row + i
+            if row < self.row_count:
+                self.__row_labels[i].config(text=str(row + 1))
+                for column, entry in enumerate(row_entries):
+                    entry.show_text(self.__text(row * self.column_count + column))
+            else:
+                self.__row_labels[i].config(text="")
+                for entry in row_entries:
+                    entry.show_text("")
+
+        if self.row_count > 0:
+            self.__scrollbar.set(first_row / self.row_count,
+                    (first_row + self.__visible_rows) / self.row_count)
+        else:
+            self.__scrollbar.set(0, 1)
+
+
+    def __text(self, index):
+        """Return the text that the entry of a cell shows."""
+        if self.__filled[index]:
+            return str(self.__values[index])
+        return self.__invalid_text.get(index, "")
+
+
+    def scroll_to(self, first_row):
+        """Scroll the grid so that first_row is the top visible row."""
+        self.__store_visible()
+        self.__show(first_row)
+
+
+    def __scroll_command(self, command, *args):
+        if command == "moveto":
+            self.scroll_to(round(float(args[0]) * self.row_count))
+        elif command == "scroll":
+            amount = int(args[0])
+            if args[1] == "pages":
+                amount *= self.__visible_rows
+            self.scroll_to(self.__first_row + amount)
+
+
+    def __visible_entry(self, row, column):
+        """Return the entry that shows a cell or None if it isn't visible."""
+        if self.__first_row <= row < self.__first_row + self.__visible_rows:
+            return self.__entries[row - self.__first_row][column]
+        return None
+
+
+    def get(self, row, column):
+        """Return the number in a cell or None if the cell is empty."""
+        index = self.__index(row, column)
+        entry = self.__visible_entry(row, column)
+        if entry is not None:
+            self.__store(row, column, entry)
+        return self.__values[index] if self.__filled[index] else None
+
+
+    def set(self, row, column, n):
+        """Put a number into a cell. If n is None, empty the cell."""
+        index = self.__index(row, column)
+        if n is None:
+            self.__values[index] = 0
+            self.__filled[index] = 0
+        else:
+            assert self.__lower_bound <= n <= self.__upper_bound, \
+                f"n must be between {self.__lower_bound} and {self.__upper_bound}"
+            self.__values[index] = n
+            self.__filled[index] = 1
+        self.__invalid_text.pop(index, None)
+        entry = self.__visible_entry(row, column)
+        if entry is not None:
+            entry.show_text(self.__text(index))
+
+
+    def values(self):
+        """Return a copy of the array with the numbers of all cells
+        and a bytearray that contains 1 for each cell that has a
+        number and 0 for each empty cell.
+        """
+        self.__store_visible()
+        return array(self.__typecode, self.__values), bytearray(self.__filled)
+
+
+    def invalid_cells(self):
+        """Return a list of tuples (row, column, text) for the cells
+        whose text isn't a number between the bounds. They are empty in
+        get and values; a form should ask the user to correct them.
+        """
+        self.__store_visible()
+        return [(*divmod(index, self.column_count), text)
+                for index, text in sorted(self.__invalid_text.items())]
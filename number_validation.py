@@ -0,0 +1,460 @@
+"""This module contains classes that decide whether text typed by a
+user is an acceptable number. IntValidator and FloatValidator use the
+same rules as the IntEntry and FloatEntry widgets in number_entry,
+and DecimalValidator and BigIntValidator the same rules as DecimalEntry
+and BigIntEntry. None of them need tkinter, so they can also be used
+to validate values that come from somewhere else.
+"""
+import re
+from decimal import Decimal
+from sys import float_info
+
+
+# Any text that int() or float() accepts and that contains only ASCII
+# characters, no underscores, and no whitespace at its ends. If text
+# has those properties and doesn't match, int() or float() would
+# raise ValueError, so the validators can reject most text without
+# raising and catching an exception.
+_SIMPLE_FLOAT = re.compile(
+        r"[+-]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?"
+        r"|[+-]?(?:inf|infinity|nan)", re.IGNORECASE)
+
+
+def contains_space(text):
+    """Return True if text contains a whitespace character."""
+    for ch in text:
+        if ch.isspace():
+            return True
+    return False
+
+
+class _NumberValidator:
+    _convert = None
+
+    def __init__(self, lower_bound, upper_bound):
+        assert type(self) != _NumberValidator, \
+            "can't create a _NumberValidator object; " \
+            "only children classes of _NumberValidator can be instantiated"
+        assert lower_bound < upper_bound, \
+            "lower_bound must be less than upper_bound"
+        self.lower_bound = lower_bound
+        self.upper_bound = upper_bound
+
+
+    def parse(self, text):
+        """Return the number in text or None if text isn't a number."""
+        # While the user types, the text is often not a number yet,
+        # for example "" or "-", so reject it without an exception.
+        if not self._is_simple(text):
+            if text.isascii() and "_" not in text and text == text.strip():
+                return None
+        # int() raises ValueError for very long
+        # text even if it contains only digits.
+        try:
+            return self._convert(text)
+        except ValueError:
+            return None
+
+
+    def in_bounds(self, n):
+        """Return True if n is between the lower and upper bound."""
+        return self.lower_bound <= n <= self.upper_bound
+
+
+    def is_valid(self, text):
+        """Return True if text is a number between the bounds."""
+        n = self.parse(text)
+        return n is not None and self.in_bounds(n)
+
+
+    def validate_key(self, current_text, text_if_allowed,
+            action=-1, index=-1, changed=""):
+        """Decide if a keystroke that changes current_text into
+        text_if_allowed should be allowed. action, index, and changed
+        describe the keystroke like the %d, %i, and %S substitutions
+        of a tkinter validatecommand. This class doesn't need them.
+        Return: a tuple (allowed, valid). valid is True if the text
+            that will be shown after the keystroke is a number between
+            the lower and upper bound.
+        """
+        allowed = valid = False
+        if not contains_space(text_if_allowed):
+            n = self.parse(text_if_allowed)
+            if n is None:
+                allowed = self._allowed_partial(text_if_allowed)
+            else:
+                allowed = self._lower_entry <= n <= self._upper_entry
+                # If text_if_allowed is allowed, we must allow it, and
+                # we must check only text_if_allowed for validity.
+                if allowed:
+                    valid = self.in_bounds(n)
+
+        # If text_if_allowed is not allowed, we must not allow
+        # it, and we must check only current_text for validity.
+        if not allowed:
+            valid = self.is_valid(current_text)
+        return allowed, valid
+
+
+    def validate_many(self, texts):
+        """Return a list that contains True for each text
+        in texts that is a number between the bounds.
+        """
+        # Most values in a batch are numbers, and since Python 3.11 a
+        # try statement costs nothing unless an exception is raised, so
+        # converting each value directly is faster than checking first.
+        convert = self._convert
+        lower = self.lower_bound
+        upper = self.upper_bound
+        results = []
+        append = results.append
+        for text in texts:
+            try:
+                append(lower <= convert(text) <= upper)
+            except ValueError:
+                append(False)
+        return results
+
+
+class IntValidator(_NumberValidator):
+    """Validates text that must be an integer between
+    an optional lower bound and an optional upper bound.
+    """
+    _convert = int
+
+    def __init__(self, lower_bound=-2**63, upper_bound=2**63 - 1):
+        assert isinstance(lower_bound, int), "lower_bound must be an integer"
+        assert isinstance(upper_bound, int), "upper_bound must be an integer"
+        super().__init__(lower_bound, upper_bound)
+
+        # While typing, the user must be allowed to enter numbers
+        # that are outside the bounds but will lead to a number
+        # inside the bounds, for example 1 when lower_bound is 10.
+        self._lower_entry = lower_bound if lower_bound <= 1 else 1
+        self._upper_entry = upper_bound if upper_bound >= -1 else -1
+        self._allow_negative = (lower_bound < 0)
+
+
+    @staticmethod
+    def _is_simple(text):
+        if text[:1] in ("+", "-"):
+            text = text[1:]
+        return text.isascii() and text.isdigit()
+
+
+    def _allowed_partial(self, text):
+        return (len(text) == 0 or
+                (self._allow_negative and text == "-"))
+
+
+class FloatValidator(_NumberValidator):
+    """Validates text that must be a number between
+    an optional lower bound and an optional upper bound.
+    """
+    _convert = float
+
+    def __init__(self, lower_bound=-float_info.max, upper_bound=float_info.max):
+        super().__init__(lower_bound, upper_bound)
+
+        if lower_bound < 0:    # [-, 0)
+            self._lower_entry = lower_bound
+        elif lower_bound < 1:  # [0, 1)
+            self._lower_entry = 0
+        else:                  # [1, +]
+            self._lower_entry = 1
+
+        if upper_bound <= -1:   # [-, -1]
+            self._upper_entry = -1
+        elif upper_bound <= 0:  # (-1, 0]
+            self._upper_entry = 0
+        else:                   # (0, +]
+            self._upper_entry = upper_bound
+
+        self._allow_negative = (lower_bound < 0)
+        self._allow_leading_dot = (
+                (-1 < lower_bound < 1) or
+                (-1 < upper_bound < 1) or
+                (lower_bound <= -1 and 1 <= upper_bound))
+
+
+    @staticmethod
+    def _is_simple(text):
+        # Most numbers are only digits and a decimal point, which
+        # can be checked faster than with the regular expression.
+        digits = text[1:] if text[:1] in ("+", "-") else text
+        digits = digits.replace(".", "", 1)
+        if digits.isascii() and digits.isdigit():
+            return True
+        return _SIMPLE_FLOAT.fullmatch(text) is not None
+
+
+    def _allowed_partial(self, text):
+        return (len(text) == 0 or
+                (self._allow_negative and text == "-") or
+                (self._allow_leading_dot and text == ".") or
+                (self._allow_negative and self._allow_leading_dot
+                    and text == "-."))
+
+
+# The kinds of text that _ScanningValidator.scan can find.
+_START = 0   # empty text
+_SIGN = 1    # only a sign
+_INT = 2     # digits, maybe with a sign
+_DOT = 3     # a decimal point without digits, maybe with a sign
+_FRAC = 4    # digits and a decimal point
+_BAD = 5     # anything else
+_BAD_STATE = (_BAD, False, 0, 0)
+_START_STATE = (_START, False, 0, 0)
+_INFINITY = Decimal("Infinity")
+_NEGATIVE_INFINITY = Decimal("-Infinity")
+
+
+class _ScanningValidator:
+    """A validator that reads the text one character at a time with a
+    small state machine instead of converting the whole text. While a
+    user types at the end of the text, only the typed characters are
+    read, so each keystroke costs the same however long the text is.
+    """
+    def __init__(self, lower_bound, upper_bound, allow_dot, places):
+        assert type(self) != _ScanningValidator, \
+            "can't create a _ScanningValidator object; " \
+            "only children classes of _ScanningValidator can be instantiated"
+        assert lower_bound is None or upper_bound is None \
+            or lower_bound < upper_bound, \
+            "lower_bound must be less than upper_bound"
+        self.lower_bound = lower_bound
+        self.upper_bound = upper_bound
+        self._allow_dot = allow_dot
+        self._places = places
+        self._allow_negative = (lower_bound is None or lower_bound < 0)
+
+        self._lower = self._bound_info(lower_bound)
+        self._upper = self._bound_info(upper_bound)
+
+        # The text of the last allowed keystroke and what was found
+        # in it, so that the next keystroke can continue from there.
+        self._text = ""
+        self._state = _START_STATE
+        self._valid = False
+
+
+    def _set_entry_bounds(self, lower_entry, upper_entry):
+        self._lower_entry = self._bound_info(lower_entry)
+        self._upper_entry = self._bound_info(upper_entry)
+
+
+    @staticmethod
+    def _bound_info(bound):
+        """Return bound with its sign and the number of digits before
+        its decimal point, which are needed to compare text to it.
+        """
+        if bound is None:
+            return None
+        magnitude = int(abs(bound))
+        digits = len(str(Decimal(magnitude))) if magnitude else 0
+        return (bound, bound < 0, digits)
+
+
+    def scan(self, text, state=_START_STATE):
+        """Read the characters in text, starting in state.
+        Return: a tuple (kind, negative, int digits, fraction digits)
+        """
+        kind, negative, int_digits, frac_digits = state
+        places = self._places
+        for ch in text:
+            if "0" <= ch <= "9":
+                if kind <= _INT:
+                    kind = _INT
+                    if int_digits or ch != "0":
+                        int_digits += 1
+                elif kind <= _FRAC:
+                    kind = _FRAC
+                    frac_digits += 1
+                    if places is not None and frac_digits > places:
+                        return _BAD_STATE
+                else:
+                    return _BAD_STATE
+            elif ch == "." and self._allow_dot and kind <= _INT:
+                kind = _DOT if kind < _INT else _FRAC
+            elif (ch == "-" or ch == "+") and kind == _START:
+                kind = _SIGN
+                negative = (ch == "-")
+            else:
+                return _BAD_STATE
+        return (kind, negative, int_digits, frac_digits)
+
+
+    @staticmethod
+    def _compare(text, state, info):
+        """Compare the number in text with a bound.
+        Return: -1, 0, or 1
+        """
+        bound, bound_negative, bound_digits = info
+        _, negative, int_digits, _ = state
+        # Text with digits before the decimal point that aren't all
+        # zero isn't zero, so often its sign and number of digits are
+        # enough to compare it to the bound without converting it.
+        if int_digits:
+            if negative != bound_negative:
+                return -1 if negative else 1
+            if int_digits != bound_digits:
+                larger = int_digits > bound_digits
+                return (-1 if larger else 1) if negative else (1 if larger else -1)
+        n = Decimal(text)
+        return (n > bound) - (n < bound)
+
+
+    def _between(self, text, state, lower, upper):
+        return ((lower is None or self._compare(text, state, lower) >= 0) and
+                (upper is None or self._compare(text, state, upper) <= 0))
+
+
+    def _state_is_valid(self, text, state):
+        return (state[0] == _INT or state[0] == _FRAC) and \
+                self._between(text, state, self._lower, self._upper)
+
+
+    def parse(self, text):
+        """Return the number in text or None if text isn't a number."""
+        state = self.scan(text)
+        if state[0] == _INT or state[0] == _FRAC:
+            return self._convert(text)
+        return None
+
+
+    def in_bounds(self, n):
+        """Return True if n is between the lower and upper bound."""
+        return ((self.lower_bound is None or self.lower_bound <= n) and
+                (self.upper_bound is None or n <= self.upper_bound))
+
+
+    def is_valid(self, text):
+        """Return True if text is a number between the bounds."""
+        return self._state_is_valid(text, self.scan(text))
+
+
+    def validate_key(self, current_text, text_if_allowed,
+            action=-1, index=-1, changed=""):
+        """Decide if a keystroke that changes current_text into
+        text_if_allowed should be allowed. If action is 1 (an insert),
+        index is the end of current_text, and changed is the inserted
+        text, only changed is read.
+        Return: a tuple (allowed, valid). valid is True if the text
+            that will be shown after the keystroke is a number between
+            the lower and upper bound.
+        """
+        if action == 1 and index == len(current_text) \
+                and current_text == self._text:
+            state = self.scan(changed, self._state)
+        else:
+            state = self.scan(text_if_allowed)
+
+        allowed = valid = False
+        kind = state[0]
+        if kind == _INT or kind == _FRAC:
+            allowed = self._between(text_if_allowed, state,
+                    self._lower_entry, self._upper_entry)
+            # If text_if_allowed is allowed, we must allow it, and
+            # we must check only text_if_allowed for validity.
+            if allowed:
+                valid = self._between(text_if_allowed, state,
+                        self._lower, self._upper)
+        elif kind != _BAD:
+            allowed = self._allowed_partial(text_if_allowed)
+
+        if allowed:
+            self._text = text_if_allowed
+            self._state = state
+            self._valid = valid
+        # If text_if_allowed is not allowed, we must not allow
+        # it, and we must check only current_text for validity.
+        elif current_text == self._text:
+            valid = self._valid
+        else:
+            valid = self.is_valid(current_text)
+        return allowed, valid
+
+
+    def validate_many(self, texts):
+        """Return a list that contains True for each text
+        in texts that is a number between the bounds.
+        """
+        scan = self.scan
+        state_is_valid = self._state_is_valid
+        return [state_is_valid(text, scan(text)) for text in texts]
+
+
+class DecimalValidator(_ScanningValidator):
+    """Validates text that must be a decimal number, like 12.50 or
+    -.5, between an optional lower bound and an optional upper bound.
+    If places is not None, at most places digits may follow the
+    decimal point. Exponents, infinities, and NaN aren't accepted.
+    """
+    def __init__(self, lower_bound=None, upper_bound=None, places=None):
+        assert places is None or (isinstance(places, int) and places >= 0), \
+            "places must be None or an integer greater than or equal to 0"
+        super().__init__(lower_bound, upper_bound, places != 0, places)
+
+        # The same rules as FloatValidator, where None means no bound.
+        if lower_bound is None or lower_bound < 0:
+            lower_entry = lower_bound
+        elif lower_bound < 1:
+            lower_entry = 0
+        else:
+            lower_entry = 1
+
+        if upper_bound is None or upper_bound > 0:
+            upper_entry = upper_bound
+        elif upper_bound > -1:
+            upper_entry = 0
+        else:
+            upper_entry = -1
+        self._set_entry_bounds(lower_entry, upper_entry)
+
+        # A missing bound is like an infinite one here.
+        lower = _NEGATIVE_INFINITY if lower_bound is None else lower_bound
+        upper = _INFINITY if upper_bound is None else upper_bound
+        self._allow_leading_dot = places != 0 and (
+                (-1 < lower < 1) or
+                (-1 < upper < 1) or
+                (lower <= -1 and 1 <= upper))
+
+
+    @staticmethod
+    def _convert(text): return Decimal(text)
+
+
+    def _allowed_partial(self, text):
+        return (len(text) == 0 or
+                (self._allow_negative and text == "-") or
+                (self._allow_leading_dot and text == ".") or
+                (self._allow_negative and self._allow_leading_dot
+                    and text == "-."))
+
+
+class BigIntValidator(_ScanningValidator):
+    """Validates text that must be an integer with any number of
+    digits between an optional lower bound and an optional upper bound.
+    Unlike IntValidator, it doesn't call int() on the text, so it
+    doesn't stop at the limit on the number of digits that int() has.
+    """
+    def __init__(self, lower_bound=None, upper_bound=None):
+        assert lower_bound is None or isinstance(lower_bound, int), \
+            "lower_bound must be None or an integer"
+        assert upper_bound is None or isinstance(upper_bound, int), \
+            "upper_bound must be None or an integer"
+        super().__init__(lower_bound, upper_bound, False, None)
+
+        # The same rules as IntValidator, where None means no bound.
+        self._set_entry_bounds(
+                lower_bound if lower_bound is None or lower_bound <= 1 else 1,
+                upper_bound if upper_bound is None or upper_bound >= -1 else -1)
+
+
+    @staticmethod
+    def _convert(text): return int(Decimal(text))
+
+
+    def _allowed_partial(self, text):
+        return (len(text) == 0 or
+                (self._allow_negative and text == "-"))
@@ -0,0 +1,230 @@
+"""Measure how long IntValidator and FloatValidator need per value.
+
+The validators are compared with the rules that IntEntry and
+FloatEntry used before number_validation existed, which called
+int() or float() and caught ValueError for every rejected value.
+Before anything is timed, the benchmark checks that the validators
+still follow those rules: is_valid and validate_many must agree on
+every value, and validate_key must give the same answers as a copy of
+the _validate_key methods that the entries had before, for random
+keystrokes and several pairs of bounds. If any answer differs, the
+benchmark prints it and exits with 1.
+
+Example:
+    python number_validation_benchmark.py --values 1000000
+"""
+import argparse
+import random
+import sys
+import time
+from sys import float_info
+
+from number_validation import IntValidator, FloatValidator
+
+# The bounds that validate_key is compared with the old rules for.
+INT_BOUNDS = [(-2**63, 2**63 - 1), (-1000, 1000), (1, 12), (10, 50),
+        (0, 10), (-50, -10), (-10, 0)]
+FLOAT_BOUNDS = [(-float_info.max, float_info.max), (-1000.0, 1000.0),
+        (0.0, 1.0), (-1.0, 1.0), (10.0, 50.0), (-50.0, -10.0),
+        (0.5, 0.75), (-0.75, -0.5), (-1.0, 0.0), (1.0, 2.0)]
+KEYS = "0123456789-+.eE _a"
+
+
+def make_values(n, seed):
+    """Return n strings that look like what users type into a form:
+    mostly numbers, some partial numbers, and some mistakes.
+    """
+    rng = random.Random(seed)
+    partial = ["", "-", ".", "-.", "1e", "abc", "12a", "3.4.5", "--1"]
+    values = []
+    for _ in range(n):
+        kind = rng.random()
+        if kind < 0.5:
+            values.append(str(rng.randint(-10_000, 10_000)))
+        elif kind < 0.8:
+            values.append(f"{rng.uniform(-10_000, 10_000):.{rng.randint(0, 4)}f}")
+        else:
+            values.append(rng.choice(partial))
+    return values
+
+
+def exception_is_valid(convert, lower, upper, texts):
+    """The rules that the entry widgets used before, as a reference."""
+    results = []
+    for text in texts:
+        try:
+            results.append(lower <= convert(text) <= upper)
+        except ValueError:
+            results.append(False)
+    return results
+
+
+# A copy of the rules of IntEntry._validate_key and
+# FloatEntry._validate_key before number_validation existed,
+# without the tkinter calls. Return: a tuple (allowed, valid)
+def _old_contains_space(text):
+    has_space = False
+    for ch in text:
+        has_space = ch.isspace()
+        if has_space:
+            break
+    return has_space
+
+
+def old_int_validate_key(lower_bound, upper_bound, current_text, text_if_allowed):
+    lower_entry = lower_bound if lower_bound <= 1 else 1
+    upper_entry = upper_bound if upper_bound >= -1 else -1
+    allow_negative = (lower_bound < 0)
+    allowed = valid = False
+    try:
+        if not _old_contains_space(text_if_allowed):
+            n = int(text_if_allowed)
+            allowed = lower_entry <= n <= upper_entry
+            if allowed:
+                valid = lower_bound <= n <= upper_bound
+    except ValueError:
+        allowed = (len(text_if_allowed) == 0 or
+                (allow_negative and text_if_allowed == "-"))
+    if not allowed:
+        try:
+            n = int(current_text)
+            valid = lower_bound <= n <= upper_bound
+        except ValueError:
+            pass
+    return allowed, valid
+
+
+def old_float_validate_key(lower_bound, upper_bound, current_text, text_if_allowed):
+    if lower_bound < 0:
+        lower_entry = lower_bound
+    elif lower_bound < 1:
+        lower_entry = 0
+    else:
+        lower_entry = 1
+    if upper_bound <= -1:
+        upper_entry = -1
+    elif upper_bound <= 0:
+        upper_entry = 0
+    else:
+        upper_entry = upper_bound
+    allow_negative = (lower_bound < 0)
+    allow_leading_dot = (
+            (-1 < lower_bound < 1) or
+            (-1 < upper_bound < 1) or
+            (lower_bound <= -1 and 1 <= upper_bound))
+    allowed = valid = False
+    try:
+        if not _old_contains_space(text_if_allowed):
+            n = float(text_if_allowed)
+            allowed = lower_entry <= n <= upper_entry
+            if allowed:
+                valid = lower_bound <= n <= upper_bound
+    except ValueError:
+        allowed = (len(text_if_allowed) == 0 or
+                (allow_negative and text_if_allowed == "-") or
+                (allow_leading_dot and text_if_allowed == ".") or
+                (allow_negative and allow_leading_dot
+                    and text_if_allowed == "-."))
+    if not allowed:
+        try:
+            n = float(current_text)
+            valid = lower_bound <= n <= upper_bound
+        except ValueError:
+            pass
+    return allowed, valid
+
+
+def make_keystrokes(values, n, seed):
+    """Return n tuples (current text, text after one keystroke), where
+    the keystroke types a character at a random place or deletes one.
+    """
+    rng = random.Random(seed)
+    keystrokes = []
+    for _ in range(n):
+        text = rng.choice(values)[:rng.randint(0, 8)]
+        index = rng.randint(0, len(text))
+        if text and rng.random() < 0.3:
+            index = min(index, len(text) - 1)
+            keystrokes.append((text, text[:index] + text[index + 1:]))
+        else:
+            keystrokes.append((text, text[:index] + rng.choice(KEYS) + text[index:]))
+    return keystrokes
+
+
+def check_rules(values, keystrokes):
+    """Return a list of messages, one for each answer of a validator
+    that differs from the rules that the entries used before.
+    """
+    mismatches = []
+    for validator_class, old_validate_key, bounds in [
+            (IntValidator, old_int_validate_key, INT_BOUNDS),
+            (FloatValidator, old_float_validate_key, FLOAT_BOUNDS)]:
+        for lower, upper in bounds:
+            validator = validator_class(lower, upper)
+            name = f"{validator_class.__name__}({lower}, {upper})"
+            many = validator.validate_many(values)
+            for text, valid in zip(values, many):
+                if validator.is_valid(text) != valid:
+                    mismatches.append(f"{name}: is_valid({text!r}) != validate_many")
+            for current, proposed in keystrokes:
+                expected = old_validate_key(lower, upper, current, proposed)
+                actual = validator.validate_key(current, proposed)
+                if actual != expected:
+                    mismatches.append(f"{name}: validate_key({current!r},"
+                            f" {proposed!r}) is {actual}, expected {expected}")
+    return mismatches
+
+
+def time_per_value(function, values, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(values)
+        best = min(best, time.perf_counter() - start)
+    return best / len(values)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--values", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--keystrokes", type=int, default=200_000,
+            help="how many random keystrokes are checked against the old rules")
+    parser.add_argument("--seed", type=int, default=2024)
+    args = parser.parse_args(argv)
+
+    values = make_values(args.values, args.seed)
+    mismatches = check_rules(values,
+            make_keystrokes(values, args.keystrokes, args.seed))
+    if mismatches:
+        for message in mismatches[:20]:
+            print(message, file=sys.stderr)
+        print(f"{len(mismatches)} answers differ from the old rules",
+                file=sys.stderr)
+        return 1
+    print(f"The validators agree with the old rules for {args.keystrokes:,}"
+            " keystrokes.")
+
+    for name, validator, convert in [
+            ("IntValidator", IntValidator(-1000, 1000), int),
+            ("FloatValidator", FloatValidator(-1000.0, 1000.0), float)]:
+        lower, upper = validator.lower_bound, validator.upper_bound
+        timings = {
+            "validate_many": time_per_value(validator.validate_many,
+                    values, args.repeat),
+            "validate_key": time_per_value(
+                    lambda texts: [validator.validate_key("", t) for t in texts],
+                    values, args.repeat),
+            "int()/float() with except": time_per_value(
+                    lambda texts: exception_is_valid(convert, lower, upper, texts),
+                    values, args.repeat),
+        }
+        for label, seconds in timings.items():
+            print(f"{name:>15} {label:>26}: {seconds * 1e9:8.1f} ns per value")
+
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
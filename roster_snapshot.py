@@ -0,0 +1,240 @@
+"""A binary snapshot of the student roster in students.csv that opens
+in constant time, however many students it has.
+
+read_dictionary in students.py makes a Python string for every field
+of the CSV file each time a program starts. A snapshot is written once
+with export_snapshot and then mapped into memory by RosterSnapshot,
+which reads nothing but the header when it opens. The file has
+
+    header   HEADER_SIZE bytes: the magic bytes, the version, the
+             number of students and the size of the names
+    keys     4 bytes per student, the I-Numbers as unsigned integers,
+             sorted
+    offsets  4 bytes per student and one more: the name of student i
+             is names[offsets[i]:offsets[i + 1]]
+    names    the names in UTF-8, one after another
+
+All numbers are little endian. A lookup is a binary search in the keys
+and decodes only the one name it finds. Because the file is only read
+through mmap, many processes that look up students can share the one
+copy of it that the operating system keeps in memory.
+
+roster_snapshot_check.py checks that a snapshot gives the same answers
+as read_dictionary for the file it was exported from.
+
+Example:
+    python roster_snapshot.py export students.csv students.snapshot
+    python roster_snapshot.py lookup students.snapshot 75-176-6201
+"""
+import bisect
+import mmap
+import os
+import struct
+import sys
+
+from students import read_dictionary
+
+MAGIC = b"ROSTER\0\0"
+VERSION = 1
+HEADER = struct.Struct("<8sHHII4x")
+HEADER_SIZE = HEADER.size
+KEY = struct.Struct("<I")
+
+INUMBER_DIGITS = 9
+KEY_INDEX = 0
+NAME_INDEX = 1
+DEFAULT_SNAPSHOT_PATH = "students.snapshot"
+
+
+def parse_inumber(inumber):
+    """Return an I-Number like "751766201" or "75-176-6201" as an
+    int, or None if it isn't 9 digits.
+    """
+    digits = inumber.replace("-", "")
+    if len(digits) != INUMBER_DIGITS or not digits.isdigit():
+        return None
+    return int(digits)
+
+
+def export_snapshot(csv_path, snapshot_path=DEFAULT_SNAPSHOT_PATH,
+        key_column_index=KEY_INDEX, name_column_index=NAME_INDEX):
+    """Write the I-Numbers and names in the CSV file csv_path to a
+    snapshot. If an I-Number is in the file more than once, the last
+    row wins, like in read_dictionary.
+    Return: the number of students in the snapshot
+    """
+    students = read_dictionary(csv_path, key_column_index)
+    rows = []
+    for inumber, row in students.items():
+        key = parse_inumber(inumber)
+        if key is None:
+            raise ValueError(f"{inumber!r} in {csv_path} isn't an I-Number")
+        rows.append((key, row[name_column_index].encode("utf-8")))
+    rows.sort()
+
+    offsets = [0]
+    for _, name in rows:
+        offsets.append(offsets[-1] + len(name))
+    # Write to a new file and replace the old one with it, so that a
+    # process that has the old snapshot mapped keeps a complete copy.
+    temporary_path = f"{snapshot_path}.tmp"
+    with open(temporary_path, "wb") as outfile:
+        outfile.write(HEADER.pack(MAGIC, VERSION, 0, len(rows), offsets[-1]))
+        outfile.write(struct.pack(f"<{len(rows)}I", *(key for key, _ in rows)))
+        outfile.write(struct.pack(f"<{len(offsets)}I", *offsets))
+        outfile.write(b"".join(name for _, name in rows))
+    os.replace(temporary_path, snapshot_path)
+    return len(rows)
+
+
+class _LittleEndianArray:
+    """The unsigned 4 byte integers in a memoryview, for computers
+    whose own byte order isn't little endian.
+    """
+    def __init__(self, view):
+        self.view = view
+
+
+    def __len__(self):
+        return len(self.view) // KEY.size
+
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("index out of range")
+        return KEY.unpack_from(self.view, index * KEY.size)[0]
+
+
+    def release(self):
+        self.view.release()
+
+
+def _uint32_array(view):
+    if sys.byteorder == "little" and struct.calcsize("I") == KEY.size:
+        return view.cast("I")
+    return _LittleEndianArray(view)
+
+
+class RosterSnapshot:
+    """A snapshot mapped into memory for reading. It can be used like
+    a read-only dict from I-Numbers to names.
+    """
+    def __init__(self, path=DEFAULT_SNAPSHOT_PATH):
+        self.path = path
+        with open(path, "rb") as infile:
+            size = os.fstat(infile.fileno()).st_size
+            if size < HEADER_SIZE:
+                raise ValueError(f"{path} is too short to be a roster snapshot")
+            # The map stays valid after the file is closed.
+            self.__map = mmap.mmap(infile.fileno(), size, access=mmap.ACCESS_READ)
+        magic, version, _, count, names_size = HEADER.unpack_from(self.__map)
+        if magic != MAGIC or version != VERSION:
+            self.__map.close()
+            raise ValueError(f"{path} isn't a roster snapshot of this version")
+        keys_end = HEADER_SIZE + count * KEY.size
+        offsets_end = keys_end + (count + 1) * KEY.size
+        if size < offsets_end + names_size:
+            self.__map.close()
+            raise ValueError(f"{path} is shorter than its header says")
+
+        self.__count = count
+        self.__view = memoryview(self.__map)
+        self.__keys = _uint32_array(self.__view[HEADER_SIZE:keys_end])
+        self.__offsets = _uint32_array(self.__view[keys_end:offsets_end])
+        self.__names = self.__view[offsets_end:offsets_end + names_size]
+
+
+    def __len__(self):
+        return self.__count
+
+
+    def __find(self, inumber):
+        """Return the index of inumber in the keys, or -1."""
+        key = parse_inumber(inumber) if isinstance(inumber, str) else None
+        if key is None:
+            return -1
+        index = bisect.bisect_left(self.__keys, key)
+        if index < self.__count and self.__keys[index] == key:
+            return index
+        return -1
+
+
+    def __name(self, index):
+        start = self.__offsets[index]
+        end = self.__offsets[index + 1]
+        return str(self.__names[start:end], "utf-8")
+
+
+    def __contains__(self, inumber):
+        return self.__find(inumber) >= 0
+
+
+    def __getitem__(self, inumber):
+        """Return the name of the student with the I-Number inumber."""
+        index = self.__find(inumber)
+        if index < 0:
+            raise KeyError(inumber)
+        return self.__name(index)
+
+
+    def get(self, inumber, default=None):
+        index = self.__find(inumber)
+        return default if index < 0 else self.__name(index)
+
+
+    def __iter__(self):
+        """Iterate over the I-Numbers in ascending order."""
+        for index in range(self.__count):
+            yield f"{self.__keys[index]:0{INUMBER_DIGITS}d}"
+
+
+    def items(self):
+        """Iterate over the tuples (I-Number, name) in ascending order."""
+        for index in range(self.__count):
+            yield f"{self.__keys[index]:0{INUMBER_DIGITS}d}", self.__name(index)
+
+
+    def close(self):
+        # The map can only be closed when no memoryview uses it anymore.
+        for view in (self.__keys, self.__offsets, self.__names, self.__view):
+            view.release()
+        self.__map.close()
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Write a snapshot of a"
+            " student roster or look up students in one.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    export = commands.add_parser("export",
+            help="write a snapshot of a CSV file")
+    export.add_argument("csv_path", nargs="?", default="students.csv")
+    export.add_argument("snapshot_path", nargs="?", default=DEFAULT_SNAPSHOT_PATH)
+    lookup = commands.add_parser("lookup",
+            help="print the names of I-Numbers")
+    lookup.add_argument("snapshot_path")
+    lookup.add_argument("inumbers", nargs="+")
+    args = parser.parse_args(argv)
+
+    if args.command == "export":
+        count = export_snapshot(args.csv_path, args.snapshot_path)
+        print(f"{count} students written to {args.snapshot_path}")
+        return 0
+    with RosterSnapshot(args.snapshot_path) as roster:
+        for inumber in args.inumbers:
+            print(f"{inumber}: {roster.get(inumber, 'No such Student')}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
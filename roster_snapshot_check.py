@@ -0,0 +1,142 @@
+"""Check that a roster snapshot gives the same answers as the CSV file
+it was exported from.
+
+The check exports students.csv, and a roster of random students with
+I-Numbers that start with zeros and names that aren't ASCII, to
+snapshots in a temporary directory. It then compares len, iteration,
+items, get, [], and in of RosterSnapshot with the dict that
+read_dictionary in students.py returns for the same file, for every
+I-Number in the file, with and without dashes, and for I-Numbers that
+aren't in it. If any answer differs, the check prints it and exits
+with 1.
+
+Example:
+    python roster_snapshot_check.py --students 10000
+"""
+import argparse
+import csv
+import os
+import random
+import sys
+import tempfile
+
+from roster_snapshot import (export_snapshot, RosterSnapshot, KEY_INDEX,
+        NAME_INDEX)
+from students import read_dictionary
+
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+FIRST_NAMES = ["James", "Zoë", "Hyeonbeom", "Søren", "Ana María", "Łukasz",
+        "Chloé", "Nguyễn", "O'Brien", "Ærin"]
+LAST_NAMES = ["Smith", "Müller", "Park", "Ririe", "García", "Østergaard",
+        "Hisler", "Ñúñez", "Thomas", "李"]
+
+# Text that isn't the I-Number of any student in the file.
+NOT_INUMBERS = ["", "-", "12345678", "1234567890", "12-345-678a", "abcdefghi",
+        " 751766201", "751766201 ", 751766201, None]
+
+
+def write_random_roster(path, count, seed):
+    """Write a CSV file like students.csv with count random students,
+    some of them with the same I-Number, to path.
+    """
+    rng = random.Random(seed)
+    with open(path, "wt", newline="", encoding="utf-8") as outfile:
+        writer = csv.writer(outfile)
+        writer.writerow(["I-Number", "Name"])
+        for _ in range(count):
+            # Small numbers, so that many I-Numbers start with zeros.
+            digits = rng.choice([4, 6, 9])
+            inumber = f"{rng.randrange(10 ** digits):09d}"
+            name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+            writer.writerow([inumber, name])
+
+
+def with_dashes(inumber):
+    return f"{inumber[:2]}-{inumber[2:5]}-{inumber[5:]}"
+
+
+def check_roster(csv_path, snapshot_path):
+    """Export csv_path to snapshot_path and return a list of messages
+    for every answer of the snapshot that differs from read_dictionary.
+    """
+    students = read_dictionary(csv_path, KEY_INDEX)
+    expected = {inumber: row[NAME_INDEX] for inumber, row in students.items()}
+    mismatches = []
+    count = export_snapshot(csv_path, snapshot_path)
+    if count != len(expected):
+        mismatches.append(f"{csv_path}: export_snapshot returned {count},"
+                f" expected {len(expected)}")
+
+    with RosterSnapshot(snapshot_path) as roster:
+        if len(roster) != len(expected):
+            mismatches.append(f"{csv_path}: len is {len(roster)},"
+                    f" expected {len(expected)}")
+        if list(roster) != sorted(expected):
+            mismatches.append(f"{csv_path}: iteration differs from the"
+                    " sorted I-Numbers")
+        if list(roster.items()) != sorted(expected.items()):
+            mismatches.append(f"{csv_path}: items differs from the sorted"
+                    " I-Numbers and names")
+
+        for inumber, name in expected.items():
+            for key in (inumber, with_dashes(inumber)):
+                answers = {
+                    "in": key in roster,
+                    "[]": roster[key] if key in roster else None,
+                    "get": roster.get(key),
+                }
+                for operation, answer in answers.items():
+                    wanted = True if operation == "in" else name
+                    if answer != wanted:
+                        mismatches.append(f"{csv_path}: {operation} {key!r}"
+                                f" is {answer!r}, expected {wanted!r}")
+
+        for key in NOT_INUMBERS + [f"{int(max(expected, default='0')) + 1:09d}"]:
+            if key in expected:
+                continue
+            if key in roster:
+                mismatches.append(f"{csv_path}: in {key!r} is True,"
+                        " expected False")
+            if roster.get(key, "missing") != "missing":
+                mismatches.append(f"{csv_path}: get {key!r} is"
+                        f" {roster.get(key)!r}, expected the default")
+            try:
+                name = roster[key]
+            except KeyError:
+                pass
+            else:
+                mismatches.append(f"{csv_path}: [] {key!r} is {name!r},"
+                        " expected KeyError")
+    return mismatches
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--students", type=int, default=5_000,
+            help="how many random students the second roster has")
+    parser.add_argument("--seed", type=int, default=2024)
+    args = parser.parse_args(argv)
+
+    mismatches = []
+    with tempfile.TemporaryDirectory() as directory:
+        random_path = os.path.join(directory, "random_students.csv")
+        write_random_roster(random_path, args.students, args.seed)
+        for csv_path in (os.path.join(DIRECTORY, "students.csv"), random_path):
+            snapshot_path = os.path.join(directory,
+                    os.path.basename(csv_path) + ".snapshot")
+            mismatches += check_roster(csv_path, snapshot_path)
+
+    if mismatches:
+        for message in mismatches[:20]:
+            print(message, file=sys.stderr)
+        print(f"{len(mismatches)} answers of the snapshots differ from"
+                " read_dictionary", file=sys.stderr)
+        return 1
+    print("The snapshots agree with read_dictionary for students.csv and"
+            f" {args.students:,} random students.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
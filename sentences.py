@@ -1,5 +1,7 @@
 import random
 
+import instrument
+
 def main(quatntity, tense):
     sentence = make_sentence(quatntity, tense)
     print(sentence)
@@ -119,6 +121,7 @@ def get_prepositional_phrase(quantity,):
   return prepositional_phrase
 
 
+@instrument.timed()
 def make_sentence(quantity, tense):
     """Build and return a sentence with three words:
     a determiner, a noun, and a verb. The grammatical
@@ -134,9 +137,10 @@ def make_sentence(quantity, tense):
     sentence = f"{determiner.capitalize()} {noun} {verb} {prepositional_phrase}."
     return sentence
 
-main(1, "past")	
-main(1, "present")
-main(1, "future")
-main(2, "past")
-main(2, "present")
-main(2, "future")
+if __name__ == "__main__":
+    main(1, "past")
+    main(1, "present")
+    main(1, "future")
+    main(2, "past")
+    main(2, "present")
+    main(2, "future")
@@ -0,0 +1,275 @@
+"""Measure how long every module of this repository takes to import
+and check the times against a budget for each module.
+
+Each module is imported in a new Python process, so that every import
+it does is really done:
+
+    cold    the bytecode cache is empty (PYTHONPYCACHEPREFIX points to
+            a new temporary directory), so every module, including the
+            standard library, is compiled from its source first, like
+            on the first start after an install
+    warm    the bytecode in __pycache__ is used, like on every later
+            start
+
+For both, the report has the time of the import itself, measured
+inside the process, and the startup time of the whole process, which
+also includes starting the interpreter. An empty module is measured
+the same way first, and its times are subtracted from the times of
+every module, so that what is left is what the module itself costs,
+not the work of the import machinery. This net warm import time is
+checked against the budget.
+
+The processes run without a display, and input is replaced by a
+function that raises an exception, so a module that opens a window or
+asks a question when it is imported fails instead of waiting. A module
+that needs one of the OPTIONAL_PACKAGES, and that package isn't
+installed, is reported as unavailable and isn't checked. Any other
+missing module, like a module of this repository that was renamed,
+fails the check.
+
+Example:
+    python startup_benchmark.py --runs 10 --output report.json
+"""
+import argparse
+import glob
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+# The most milliseconds that importing a module with warm caches may
+# take, more than importing an empty module. Modules that aren't
+# listed have DEFAULT_BUDGET_MS.
+DEFAULT_BUDGET_MS = 40
+# About twice the slowest of three runs on a development machine, with
+# the bytecode in __pycache__.
+BUDGETS = {
+    # The programs only start dice_app when they are run.
+    "dice.py": 2,
+    "dice-en.py": 2,
+    "dice_strings_de.py": 2,
+    "dice_strings_en.py": 2,
+    "mouse_wheel.py": 2,
+    "windchill.py": 2,
+    # Modules without tkinter, which programs without a window use.
+    "instrument.py": 6,
+    "function project.py": 6,
+    "dice_core.py": 10,
+    "dice_rng.py": 10,
+    "dice_worker.py": 12,
+    "loops project.py": 12,
+    "sentences.py": 12,
+    "dice_log.py": 15,
+    "dice_stats.py": 15,
+    "students.py": 16,
+    "number_validation.py": 22,
+    "roster_snapshot.py": 25,
+    "dice_log_check.py": 30,
+    "number_validation_benchmark.py": 35,
+    "roster_snapshot_check.py": 40,
+    "dice_rng_benchmark.py": 40,
+    # tkinter alone takes about 15 ms.
+    "dice_layout.py": 40,
+    "number_entry.py": 45,
+    "number_grid.py": 45,
+    "dice_render.py": 50,
+    "windchill_benchmark.py": 50,
+    "dice_render_benchmark.py": 55,
+    "dice_app.py": 60,
+    "number_entry_harness.py": 85,
+    "dice_faces.py": 250,       # imports matplotlib
+}
+
+# Third-party packages that some modules need and that may not be
+# installed. A module that can't import one of them is only reported.
+OPTIONAL_PACKAGES = ("matplotlib", "numpy")
+
+# Runs in the new process. The time is printed on the last line,
+# after anything that the module prints itself.
+IMPORT_CODE = """\
+import builtins, importlib.util, sys, time
+def no_input(prompt=""):
+    raise RuntimeError(f"input({{prompt!r}}) was called while importing")
+builtins.input = no_input
+start = time.perf_counter()
+spec = importlib.util.spec_from_file_location({name!r}, {path!r})
+module = importlib.util.module_from_spec(spec)
+sys.modules[{name!r}] = module
+spec.loader.exec_module(module)
+print(time.perf_counter() - start)
+"""
+
+
+def module_name(filename):
+    """Return the name under which a file is imported, with the
+    characters that can't be in a name, like in dice-en.py, replaced.
+    """
+    stem = os.path.splitext(filename)[0]
+    return "".join(c if c.isalnum() or c == "_" else "_" for c in stem)
+
+
+def find_modules():
+    """Return the names of the Python files in this directory."""
+    this = os.path.basename(__file__)
+    return sorted(os.path.basename(path)
+            for path in glob.glob(os.path.join(DIRECTORY, "*.py"))
+            if os.path.basename(path) != this)
+
+
+def is_optional_package(error):
+    """Return True if error, the last line of a traceback, says that
+    one of the OPTIONAL_PACKAGES isn't installed.
+    """
+    prefix = "ModuleNotFoundError: No module named "
+    if not error.startswith(prefix):
+        return False
+    missing = error[len(prefix):].strip("'\"")
+    package = missing.split(".")[0]
+    # A file of this repository with the name of the package would be
+    # found first, so the package isn't what is missing.
+    if os.path.exists(os.path.join(DIRECTORY, package + ".py")):
+        return False
+    return package in OPTIONAL_PACKAGES
+
+
+def headless_environment(cache_prefix=None):
+    env = dict(os.environ)
+    # Without bytecode files, a warm run would compile the module
+    # from its source like a cold one.
+    for name in ("DISPLAY", "WAYLAND_DISPLAY", "INSTRUMENT",
+            "PYTHONDONTWRITEBYTECODE", "PYTHONPYCACHEPREFIX"):
+        env.pop(name, None)
+    if cache_prefix is not None:
+        env["PYTHONPYCACHEPREFIX"] = cache_prefix
+    return env
+
+
+def import_once(path, cache_prefix=None):
+    """Import the file path in a new process.
+    Return: a tuple (import seconds, startup seconds, error), where
+        error is None, "unavailable: ..." if one of the
+        OPTIONAL_PACKAGES is missing, or the last line that the process
+        wrote to stderr
+    """
+    code = IMPORT_CODE.format(name=module_name(os.path.basename(path)),
+            path=path)
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-c", code],
+            stdin=subprocess.DEVNULL, capture_output=True, text=True,
+            cwd=DIRECTORY, env=headless_environment(cache_prefix))
+    startup = time.perf_counter() - start
+    if result.returncode != 0:
+        lines = result.stderr.strip().splitlines() or ["no output"]
+        if is_optional_package(lines[-1]):
+            return None, None, f"unavailable: {lines[-1]}"
+        return None, None, lines[-1]
+    return float(result.stdout.split()[-1]), startup, None
+
+
+def measure(path, runs, cold_runs):
+    """Return the median times of importing the file path in
+    milliseconds as a dict, or a dict with only an error.
+    """
+    # The first warm run may still have to write the bytecode.
+    _, _, error = import_once(path)
+    if error is not None:
+        return {"error": error}
+    times = {}
+    for kind, count in (("cold", cold_runs), ("warm", runs)):
+        imports = []
+        startups = []
+        for _ in range(count):
+            if kind == "cold":
+                with tempfile.TemporaryDirectory() as prefix:
+                    seconds, startup, error = import_once(path, prefix)
+            else:
+                seconds, startup, error = import_once(path)
+            if error is not None:
+                return {"error": error}
+            imports.append(seconds * 1000)
+            startups.append(startup * 1000)
+        times[f"{kind}_import_ms"] = statistics.median(imports)
+        times[f"{kind}_startup_ms"] = statistics.median(startups)
+    return times
+
+
+def measure_baseline(runs, cold_runs):
+    """Return the times of importing an empty module, like measure."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "startup_baseline.py")
+        open(path, "wt").close()
+        times = measure(path, runs, cold_runs)
+    if "error" in times:
+        raise RuntimeError(f"can't import an empty module: {times['error']}")
+    return times
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("modules", nargs="*",
+            help="the files to measure (default: every Python file here)")
+    parser.add_argument("--runs", type=int, default=7,
+            help="warm runs per module (default 7)")
+    parser.add_argument("--cold-runs", type=int, default=2,
+            help="cold runs per module (default 2)")
+    parser.add_argument("--budget-scale", type=float, default=1.0,
+            help="multiply every budget, for slower machines")
+    parser.add_argument("--output", default="startup_benchmark.json",
+            help="file where the JSON report is written")
+    args = parser.parse_args(argv)
+
+    baseline = measure_baseline(args.runs, args.cold_runs)
+    print(f"{'empty module':>28}  import {baseline['warm_import_ms']:7.1f} ms"
+            f" (cold {baseline['cold_import_ms']:7.1f})"
+            f"  startup {baseline['warm_startup_ms']:7.1f} ms"
+            f" (cold {baseline['cold_startup_ms']:7.1f})")
+    report = {
+        "python": platform.python_version(),
+        "baseline": baseline,
+        "modules": {},
+    }
+    failed = []
+    for filename in args.modules or find_modules():
+        budget = BUDGETS.get(filename, DEFAULT_BUDGET_MS) * args.budget_scale
+        result = measure(os.path.join(DIRECTORY, filename),
+                args.runs, args.cold_runs)
+        result["budget_ms"] = budget
+        report["modules"][filename] = result
+        error = result.get("error")
+        if error is not None:
+            print(f"{filename:>28}  {error}")
+            if not error.startswith("unavailable"):
+                failed.append(filename)
+            continue
+        for kind in ("cold", "warm"):
+            result[f"{kind}_net_import_ms"] = max(result[f"{kind}_import_ms"]
+                    - baseline[f"{kind}_import_ms"], 0.0)
+        over = result["warm_net_import_ms"] > budget
+        if over:
+            failed.append(filename)
+        print(f"{filename:>28}  import {result['warm_net_import_ms']:7.1f} ms"
+                f" (cold {result['cold_net_import_ms']:7.1f})"
+                f"  startup {result['warm_startup_ms']:7.1f} ms"
+                f" (cold {result['cold_startup_ms']:7.1f})"
+                f"  budget {budget:5.0f} ms{'  OVER' if over else ''}",
+                flush=True)
+
+    report["failed"] = failed
+    with open(args.output, "wt") as outfile:
+        json.dump(report, outfile, indent=2)
+    print(f"Report written to {args.output}")
+
+    if failed:
+        print(f"Over budget or failed: {', '.join(failed)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,7 +3,10 @@
 
 import csv
 
+import instrument
 
+
+@instrument.timed()
 def read_dictionary(filename, key_column_index):
     s_dictionary={}
     with open(filename, "rt") as csvfile:
@@ -0,0 +1,270 @@
+"""Functions that compute the wind chill temperature.
+
+The wind chill formula used by the National Weather Service works
+in degrees Fahrenheit and miles per hour. The functions in this
+module accept and return temperatures in Fahrenheit ("F"), Celsius
+("C"), or Kelvin ("K"). None of them read from the keyboard or
+print, so this module can be imported by any other program.
+
+Temperatures and wind speeds usually come in whole degrees and
+steps of 1 or 5 mph, so cached_wind_chill keeps recent results in
+a least recently used cache. Use configure_cache to change its size
+and cache_info to see how many calls were hits and misses.
+"""
+from functools import lru_cache
+
+UNITS = ("F", "C", "K")
+
+# The wind speeds in miles per hour that the
+# interactive wind chill table has always shown.
+DEFAULT_SPEEDS = range(5, 65, 5)
+
+DEFAULT_CACHE_SIZE = 4096
+
+
+def _check_unit(unit):
+    if unit not in UNITS:
+        raise ValueError(f"unit must be one of {', '.join(UNITS)}, not {unit!r}")
+
+
+def _check_speed(speed_mph):
+    # A negative number to the power 0.16 is a complex number.
+    if speed_mph < 0:
+        raise ValueError(f"speed_mph must not be negative, not {speed_mph!r}")
+
+
+def to_fahrenheit(temperature, unit="F"):
+    """Convert a temperature in the given unit to degrees Fahrenheit.
+    Parameters
+        temperature: a number
+        unit: "F", "C", or "K"
+    Return: the temperature in degrees Fahrenheit
+    """
+    _check_unit(unit)
+    if unit == "C":
+        temperature = temperature * 1.8 + 32
+    elif unit == "K":
+        temperature = (temperature - 273.15) * 1.8 + 32
+    return temperature
+
+
+def from_fahrenheit(temperature_f, unit="F"):
+    """Convert a temperature in degrees Fahrenheit to the given unit.
+    Parameters
+        temperature_f: a number in degrees Fahrenheit
+        unit: "F", "C", or "K"
+    Return: the temperature in the requested unit
+    """
+    _check_unit(unit)
+    if unit == "C":
+        temperature_f = (temperature_f - 32) / 1.8
+    elif unit == "K":
+        temperature_f = (temperature_f - 32) / 1.8 + 273.15
+    return temperature_f
+
+
+def convert_temperature(temperature, from_unit, to_unit):
+    """Convert a temperature from one unit to another."""
+    return from_fahrenheit(to_fahrenheit(temperature, from_unit), to_unit)
+
+
+def wind_chill_f(temperature_f, speed_mph):
+    """Return the wind chill in degrees Fahrenheit for a temperature
+    in degrees Fahrenheit and a wind speed in miles per hour.
+    Raise ValueError if speed_mph is negative.
+    """
+    _check_speed(speed_mph)
+    speed_factor = speed_mph ** 0.16
+    return (35.74 + 0.6215 * temperature_f
+            - 35.75 * speed_factor
+            + 0.4275 * temperature_f * speed_factor)
+
+
+def wind_chill(temperature, speed_mph, unit="F", result_unit=None):
+    """Compute the wind chill temperature.
+    Parameters
+        temperature: the air temperature in the given unit
+        speed_mph: the wind speed in miles per hour
+        unit: the unit of temperature, "F", "C", or "K"
+        result_unit: the unit of the returned wind chill;
+            if None, the same unit as temperature
+    Return: the wind chill temperature in result_unit
+    Raise ValueError if speed_mph is negative.
+    """
+    if result_unit is None:
+        result_unit = unit
+    chill_f = wind_chill_f(to_fahrenheit(temperature, unit), speed_mph)
+    return from_fahrenheit(chill_f, result_unit)
+
+
+def wind_chill_table(temperature, unit="F", speeds=DEFAULT_SPEEDS,
+        result_unit=None):
+    """Compute the wind chill for one temperature at several wind speeds.
+    If result_unit is None, the wind chill is in the same unit as
+    temperature, like in wind_chill.
+    Return: a list of (speed, wind chill) tuples, one for each speed
+    """
+    return [(speed, cached_wind_chill(temperature, speed, unit, result_unit))
+            for speed in speeds]
+
+
+_cached = lru_cache(maxsize=DEFAULT_CACHE_SIZE)(wind_chill)
+
+
+def cached_wind_chill(temperature, speed_mph, unit="F", result_unit=None):
+    """Same as wind_chill, but return a remembered result
+    if it was already computed for the same arguments.
+    """
+    return _cached(temperature, speed_mph, unit, result_unit)
+
+
+def configure_cache(maxsize=DEFAULT_CACHE_SIZE):
+    """Replace the wind chill cache with an empty one that holds at
+    most maxsize results. If maxsize is None, the cache has no limit.
+    """
+    global _cached
+    if maxsize is not None:
+        assert isinstance(maxsize, int) and maxsize >= 0, \
+            "maxsize must be None or an integer greater than or equal to 0"
+    _cached = lru_cache(maxsize=maxsize)(wind_chill)
+
+
+def cache_info():
+    """Return the hits, misses, maxsize, and currsize of the cache."""
+    return _cached.cache_info()
+
+
+def cache_clear():
+    """Remove all results and statistics from the cache."""
+    _cached.cache_clear()
+
+
+def wind_chill_many(temperatures, speeds_mph, unit="F", result_unit=None):
+    """Compute the wind chill for many temperatures and wind speeds at
+    once. If numpy is installed, the inputs are converted to arrays and
+    the whole computation is vectorized, and an array is returned.
+    Otherwise a list is returned.
+    Parameters
+        temperatures: a sequence of temperatures in the given unit
+        speeds_mph: a sequence of wind speeds, the same length
+            as temperatures
+    Raise ValueError if any of the speeds is negative.
+    """
+    if result_unit is None:
+        result_unit = unit
+    _check_unit(unit)
+    _check_unit(result_unit)
+    try:
+        import numpy as np
+    except ImportError:
+        return [wind_chill(t, s, unit, result_unit)
+                for t, s in zip(temperatures, speeds_mph)]
+
+    temps = np.asarray(temperatures, dtype=float)
+    speeds = np.asarray(speeds_mph, dtype=float)
+    if speeds.size and speeds.min() < 0:
+        _check_speed(float(speeds.min()))
+    speed_factor = speeds ** 0.16
+    temps_f = to_fahrenheit(temps, unit)
+    chill_f = (35.74 + 0.6215 * temps_f
+            - 35.75 * speed_factor
+            + 0.4275 * temps_f * speed_factor)
+    return from_fahrenheit(chill_f, result_unit)
+
+
+class WindChillTable:
+    """A table of wind chill values computed ahead of time for whole
+    degree temperatures between lower and upper and for the given wind
+    speeds. Looking up a value is an index computation instead of
+    evaluating the formula. Temperatures are rounded to the nearest
+    whole degree and speeds to the nearest speed in the table. The
+    speeds must be in increasing order without repeats. Like wind_chill,
+    the constructor and the lookups raise ValueError for negative speeds.
+    """
+    def __init__(self, lower, upper, unit="F", speeds=range(0, 101),
+            result_unit=None):
+        assert isinstance(lower, int) and isinstance(upper, int), \
+            "lower and upper must be integers"
+        assert lower <= upper, "lower must be less than or equal to upper"
+        speeds = list(speeds)
+        assert len(speeds) > 0, "speeds must not be empty"
+        # A repeated speed would make the step between evenly spaced
+        # speeds 0, and finding a column would divide by it.
+        assert all(a < b for a, b in zip(speeds, speeds[1:])), \
+            "speeds must be strictly increasing"
+        _check_speed(speeds[0])
+        if result_unit is None:
+            result_unit = unit
+        self.lower = lower
+        self.upper = upper
+        self.unit = unit
+        self.result_unit = result_unit
+        self.speeds = speeds
+
+        # When the speeds are evenly spaced, a speed
+        # can be turned into a column by arithmetic.
+        self._speed_start = speeds[0]
+        self._speed_step = speeds[1] - speeds[0] if len(speeds) > 1 else 1
+        self._even = all(speeds[i] == self._speed_start + i * self._speed_step
+                for i in range(len(speeds)))
+        self._columns = {speed: i for i, speed in enumerate(speeds)}
+
+        self._width = len(speeds)
+        self._values = [wind_chill(t, s, unit, result_unit)
+                for t in range(lower, upper + 1) for s in speeds]
+
+
+    def _column(self, speed_mph):
+        if self._even:
+            column = round((speed_mph - self._speed_start) / self._speed_step)
+            return min(max(column, 0), self._width - 1)
+        column = self._columns.get(speed_mph)
+        if column is None:
+            nearest = min(self.speeds, key=lambda s: abs(s - speed_mph))
+            column = self._columns[nearest]
+        return column
+
+
+    def lookup(self, temperature, speed_mph):
+        """Return the wind chill for temperature and speed_mph."""
+        _check_speed(speed_mph)
+        row = round(temperature) - self.lower
+        if not 0 <= row <= self.upper - self.lower:
+            raise ValueError(f"temperature must be between"
+                    f" {self.lower} and {self.upper}")
+        return self._values[row * self._width + self._column(speed_mph)]
+
+
+    def lookup_many(self, temperatures, speeds_mph):
+        """Return a list of the wind chill for each pair of
+        temperature and wind speed.
+        """
+        if not self._even:
+            lookup = self.lookup
+            return [lookup(t, s) for t, s in zip(temperatures, speeds_mph)]
+
+        # The same index computation as lookup, written out
+        # in one place so the loop makes no method calls.
+        values = self._values
+        width = self._width
+        lower = self.lower
+        rows = self.upper - lower
+        start = self._speed_start
+        step = self._speed_step
+        last = width - 1
+        result = []
+        append = result.append
+        for t, s in zip(temperatures, speeds_mph):
+            row = round(t) - lower
+            if not 0 <= row <= rows:
+                raise ValueError(f"temperature must be between"
+                        f" {lower} and {self.upper}")
+            if s < 0:
+                _check_speed(s)
+            column = round((s - start) / step)
+            if column < 0:
+                column = 0
+            elif column > last:
+                column = last
+            append(values[row * width + column])
+        return result
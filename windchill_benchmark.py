@@ -0,0 +1,171 @@
+"""Measure the speed, memory use, and accuracy of the ways the
+windchill module can compute many wind chill values:
+
+    scalar      calling wind_chill once for each point
+    cached      calling cached_wind_chill once for each point
+    vectorized  calling wind_chill_many (numpy if it is installed)
+    table       calling WindChillTable.lookup_many
+
+Every fast path is compared against the scalar formula, and the
+results are written as JSON so that two runs can be compared.
+
+Example:
+    python windchill_benchmark.py --max-exp 8 --output report.json
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+import windchill
+
+# Inputs are quantized like the data in our feeds: whole
+# degrees Celsius and wind speeds in steps of 5 mph.
+LOWER_TEMP = -40
+UPPER_TEMP = 40
+SPEEDS = range(5, 65, 5)
+UNIT = "C"
+
+# Points are generated and computed in chunks of this size so
+# that the largest runs don't need all their inputs in memory.
+CHUNK_SIZE = 1_000_000
+
+
+def make_inputs(n, seed):
+    rng = random.Random(seed)
+    temps = [rng.randint(LOWER_TEMP, UPPER_TEMP) for _ in range(n)]
+    speeds = [rng.choice(SPEEDS) for _ in range(n)]
+    return temps, speeds
+
+
+def make_paths():
+    table = windchill.WindChillTable(LOWER_TEMP, UPPER_TEMP, UNIT, SPEEDS)
+    paths = {
+        "scalar": lambda temps, speeds: [windchill.wind_chill(t, s, UNIT)
+                for t, s in zip(temps, speeds)],
+        "cached": lambda temps, speeds: [windchill.cached_wind_chill(t, s, UNIT)
+                for t, s in zip(temps, speeds)],
+        "vectorized": lambda temps, speeds:
+                windchill.wind_chill_many(temps, speeds, UNIT),
+        "table": table.lookup_many,
+    }
+    return paths
+
+
+def measure_time(compute, n, seed):
+    """Return the number of seconds compute needs for n points."""
+    elapsed = 0.0
+    done = 0
+    chunk = 0
+    while done < n:
+        size = min(CHUNK_SIZE, n - done)
+        temps, speeds = make_inputs(size, seed + chunk)
+        start = time.perf_counter()
+        compute(temps, speeds)
+        elapsed += time.perf_counter() - start
+        done += size
+        chunk += 1
+    return elapsed
+
+
+def measure_memory(compute, n, seed):
+    """Return the peak number of bytes allocated per point while
+    computing n points, not counting the inputs.
+    """
+    temps, speeds = make_inputs(n, seed)
+    tracemalloc.start()
+    try:
+        result = compute(temps, speeds)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak / n
+
+
+def measure_error(compute, n, seed):
+    """Return the largest absolute and relative difference
+    between compute and the reference formula.
+    """
+    temps, speeds = make_inputs(n, seed)
+    expected = [windchill.wind_chill(t, s, UNIT) for t, s in zip(temps, speeds)]
+    actual = compute(temps, speeds)
+    max_abs = max_rel = 0.0
+    for e, a in zip(expected, actual):
+        diff = abs(float(a) - e)
+        max_abs = max(max_abs, diff)
+        if e != 0:
+            max_rel = max(max_rel, diff / abs(e))
+    return max_abs, max_rel
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--min-exp", type=int, default=3,
+            help="smallest run is 10**MIN_EXP points (default 3)")
+    parser.add_argument("--max-exp", type=int, default=6,
+            help="largest run is 10**MAX_EXP points (default 6, up to 8)")
+    parser.add_argument("--memory-points", type=int, default=100_000,
+            help="number of points used to measure memory per point")
+    parser.add_argument("--accuracy-points", type=int, default=100_000,
+            help="number of points compared against the formula")
+    parser.add_argument("--tolerance", type=float, default=1e-9,
+            help="largest allowed absolute error of a fast path")
+    parser.add_argument("--seed", type=int, default=2024)
+    parser.add_argument("--output", default="windchill_benchmark.json",
+            help="file where the JSON report is written")
+    args = parser.parse_args(argv)
+
+    try:
+        import numpy
+        numpy_version = numpy.__version__
+    except ImportError:
+        numpy_version = None
+
+    report = {
+        "python": platform.python_version(),
+        "numpy": numpy_version,
+        "tolerance": args.tolerance,
+        "paths": {},
+    }
+    failed = []
+    for name, compute in make_paths().items():
+        windchill.cache_clear()
+        max_abs, max_rel = measure_error(compute, args.accuracy_points, args.seed)
+        result = {
+            "max_abs_error": max_abs,
+            "max_rel_error": max_rel,
+            "bytes_per_point": measure_memory(compute, args.memory_points, args.seed),
+            "runs": [],
+        }
+        if max_abs > args.tolerance:
+            failed.append(name)
+
+        for exp in range(args.min_exp, args.max_exp + 1):
+            n = 10 ** exp
+            seconds = measure_time(compute, n, args.seed)
+            result["runs"].append({
+                "points": n,
+                "seconds": seconds,
+                "points_per_second": n / seconds if seconds > 0 else None,
+            })
+            print(f"{name:>10} {n:>11,} points {seconds:9.4f} s", flush=True)
+        report["paths"][name] = result
+
+    report["failed"] = failed
+    with open(args.output, "wt") as outfile:
+        json.dump(report, outfile, indent=2)
+    print(f"Report written to {args.output}")
+
+    if failed:
+        print(f"Error larger than {args.tolerance} in: {', '.join(failed)}",
+                file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())